@@ -19,14 +19,29 @@ import json
 import logging
 import shutil
 import re
+import mmap
 from datetime import datetime
+from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Iterator, Union
 import traceback
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing
+    orjson = None
 
 try:
     import click
-    from jinja2 import Environment, FileSystemLoader, Template
     import colorlog
 except ImportError as e:
     print(f"ERROR: Missing required dependency: {e}")
@@ -34,13 +49,160 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Linux ioctl request code for a copy-on-write file clone
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
+
+# Buffer size for the portable copy fallback
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Minimum tree size before backups on Windows are delegated to robocopy
+ROBOCOPY_MIN_FILES = 1000
+
+# Worker threads used to copy files into a backup
+BACKUP_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Worker threads used to run the per-file update steps of one apply run
+UPDATE_WORKERS = 4
+
+# Log formatters shared by every FieldModifier instance
+CONSOLE_LOG_FORMATTER = colorlog.ColoredFormatter(
+    '%(log_color)s%(levelname)-8s%(reset)s %(blue)s%(message)s',
+    log_colors={
+        'DEBUG': 'cyan',
+        'INFO': 'green',
+        'WARNING': 'yellow',
+        'ERROR': 'red',
+        'CRITICAL': 'red,bg_white',
+    }
+)
+FILE_LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
+)
+
+# File extensions searched for field usage, as tuples so a single str.endswith call can test them
+JAVA_EXTENSIONS = ('.java',)
+FRONTEND_EXTENSIONS = ('.js', '.ts')
+SQL_EXTENSIONS = ('.sql',)
+
+# Flyway versioned migration file name, capturing the version number
+MIGRATION_VERSION_PATTERN = re.compile(r'V(\d+)__.*\.sql')
+
+# Finder methods appended to a repository interface for each new searchable String field
+REPOSITORY_METHOD_TEMPLATE = """
+    /**
+     * Find {entity_lower}s by {field_human}.
+     * 
+     * @param {camel} the {field_human}
+     * @return list of {entity_lower}s
+     */
+    List<{entity}> findBy{pascal}(String {camel});
+    
+    /**
+     * Find {entity_lower}s by {field_human} containing text (case-insensitive).
+     * 
+     * @param {camel} the {field_human} to search for
+     * @return list of {entity_lower}s
+     */
+    List<{entity}> findBy{pascal}ContainingIgnoreCase(String {camel});
+
+"""
+
+# Literal test values for non-String Java field types
+JAVA_TEST_VALUES = {
+    "Boolean": "true",
+    "Integer": "1",
+    "Long": "1",
+    "BigDecimal": "new BigDecimal(\"100.00\")",
+    "LocalDateTime": "LocalDateTime.now()",
+    "LocalDate": "LocalDate.now()"
+}
+
+# TypeScript equivalents of the supported Java field types
+JAVA_TO_TYPESCRIPT_TYPES = {
+    "String": "string",
+    "Boolean": "boolean",
+    "Integer": "number",
+    "Long": "number",
+    "BigDecimal": "number",
+    "LocalDateTime": "string",
+    "LocalDate": "string"
+}
+
+# Files below this size are read into a shared buffer instead of being memory-mapped
+SMALL_FILE_SIZE_LIMIT = 8 * 1024
+
+# Foreign key clause in migration SQL, capturing the referenced table and column
+FOREIGN_KEY_REFERENCE_PATTERN = re.compile(rb'REFERENCES\s+(\w+)\s*\(\s*(\w+)\s*\)')
+
+
+@lru_cache(maxsize=None)
+def _jinja_env(templates_dir: str):
+    """Build the Jinja2 environment for a template directory once; Jinja2 is imported on first use."""
+    from jinja2 import Environment, FileSystemLoader
+    return Environment(loader=FileSystemLoader(templates_dir), auto_reload=False, cache_size=400)
+
+
+@lru_cache(maxsize=None)
+def _get_migration_template(templates_dir: str):
+    """Load and compile the field-operations migration template once per template directory."""
+    return _jinja_env(templates_dir).get_template("migration_alter.sql.j2")
+
+
+def _load_json(path) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=64)
+def _affected_files(service_name: str, entity_name: str) -> Tuple[str, ...]:
+    """Project-relative paths of the files touched when a service's fields change."""
+    return (
+        f"src/main/java/com/vira/{service_name}/model/{entity_name}.java",
+        f"src/main/java/com/vira/{service_name}/dto/{entity_name}Request.java",
+        f"src/main/java/com/vira/{service_name}/dto/{entity_name}Response.java",
+        f"src/main/java/com/vira/{service_name}/service/{entity_name}Service.java",
+        f"src/main/java/com/vira/{service_name}/repository/{entity_name}Repository.java",
+        f"src/main/java/com/vira/{service_name}/controller/{entity_name}Controller.java",
+        f"src/test/java/com/vira/{service_name}/service/{entity_name}ServiceTest.java",
+        f"src/test/java/com/vira/{service_name}/controller/{entity_name}ControllerTest.java",
+        f"src/main/resources/frontend/api/{entity_name.lower()}ApiService.js"
+    )
+
+
+@lru_cache(maxsize=1024)
+def _name_variants(snake_str: str) -> Tuple[str, str, str]:
+    """Return (snake_case, camelCase, PascalCase) variants of a field name from a single split."""
+    components = snake_str.split('_')
+    capitalized = list(map(str.capitalize, components))
+    camel_case = components[0] + ''.join(capitalized[1:])
+    pascal_case = ''.join(capitalized)
+    return snake_str, camel_case, pascal_case
+
+
+@lru_cache(maxsize=1024)
+def _to_camel_case(snake_str: str) -> str:
+    """Convert snake_case to camelCase."""
+    return _name_variants(snake_str)[1]
+
+
+@lru_cache(maxsize=1024)
+def _to_pascal_case(snake_str: str) -> str:
+    """Convert snake_case to PascalCase."""
+    return _name_variants(snake_str)[2]
+
+
 class FieldOperation:
     """Represents a single field operation (add/update/remove)."""
     
     def __init__(self, action: str, field_data: Dict[str, Any]):
-        self.action = action.lower()
+        # Interned so the many action comparisons downstream are identity checks
+        self.action = sys.intern(action.lower())
         self.field_data = field_data
         self.validate()
+        self._prepare_impact()
     
     def validate(self):
         """Validate the field operation."""
@@ -62,6 +224,99 @@ class FieldOperation:
         elif self.action == 'remove':
             if 'field_name' not in self.field_data:
                 raise ValueError("Remove operation requires 'field_name'")
+    
+    def _prepare_impact(self):
+        """Pre-compute the table-independent parts of the impact analysis."""
+        self.migration_change_type = None
+        self.risks = []
+        self.breaking_changes = []
+        # SQL is stored as the text before and after the table name, which is bound later
+        self._sql_parts = None
+        
+        if self.action == 'add':
+            field = self.field_data['field']
+            if isinstance(field['javaType'], str):
+                field['javaType'] = sys.intern(field['javaType'])
+            self.field_name = field['name']
+            self.migration_change_type = "ADD_COLUMN"
+            self._sql_parts = ("ALTER TABLE ", f" ADD COLUMN {field['name']} {field['type']}")
+            
+            if not field.get('nullable', True) and 'default_value' not in field:
+                self.risks.append(
+                    f"Adding non-nullable field '{field['name']}' without default value may fail if table has data"
+                )
+        
+        elif self.action == 'update':
+            self.field_name = self.field_data['field_name']
+            changes = self.field_data['changes']
+            
+            if 'type' in changes:
+                self.migration_change_type = "MODIFY_COLUMN"
+                self._sql_parts = ("ALTER TABLE ", f" ALTER COLUMN {self.field_name} TYPE {changes['type']}")
+                self.risks.append(
+                    f"Changing type of field '{self.field_name}' may cause data loss if incompatible"
+                )
+        
+        elif self.action == 'remove':
+            self.field_name = self.field_data['field_name']
+            self.migration_change_type = "DROP_COLUMN"
+            self._sql_parts = ("-- ALTER TABLE ", f" DROP COLUMN {self.field_name}; -- REQUIRES MANUAL CONFIRMATION")
+            self.breaking_changes.append(
+                f"Removing field '{self.field_name}' will break any code that references it"
+            )
+        
+        # Case variants shared by the repository, test and React update passes
+        _, self.camel_name, self.pascal_name = _name_variants(self.field_name)
+        self.display_name = self.field_name.replace('_', ' ')
+    
+    def migration_change_for(self, table_name: str) -> Optional[Dict[str, str]]:
+        """Return the migration change for this operation bound to a table, if any."""
+        if self._sql_parts is None:
+            return None
+        
+        sql_prefix, sql_suffix = self._sql_parts
+        return {
+            "type": self.migration_change_type,
+            "field_name": self.field_name,
+            "sql": sql_prefix + table_name + sql_suffix
+        }
+
+
+def fold_field_operations(operations: List[FieldOperation]) -> List[FieldOperation]:
+    """
+    Fold repeated operations on the same field into their net effect.
+    
+    Each surviving operation keeps the position of the first operation it was
+    folded from, so operations on different fields are applied in the order given.
+    Sequences with no single equivalent, such as a remove followed by an add, are kept.
+    """
+    folded: List[Optional[FieldOperation]] = []
+    # Positions in folded of each field's surviving operations, most recent last
+    positions: Dict[str, List[int]] = {}
+    
+    for operation in operations:
+        field_positions = positions.setdefault(operation.field_name, [])
+        previous = folded[field_positions[-1]] if field_positions else None
+        
+        if previous is None:
+            field_positions.append(len(folded))
+            folded.append(operation)
+        elif previous.action == 'add' and operation.action == 'remove':
+            # Adding a field and removing it again is a no-op
+            folded[field_positions.pop()] = None
+        elif previous.action == 'add' and operation.action == 'update':
+            merged_field = {**previous.field_data['field'], **operation.field_data['changes']}
+            folded[field_positions[-1]] = FieldOperation('add', {**previous.field_data, 'field': merged_field})
+        elif previous.action == 'update' and operation.action == 'update':
+            merged_changes = {**previous.field_data['changes'], **operation.field_data['changes']}
+            folded[field_positions[-1]] = FieldOperation('update', {**previous.field_data, 'changes': merged_changes})
+        elif previous.action == 'remove' and operation.action == 'remove':
+            continue
+        else:
+            field_positions.append(len(folded))
+            folded.append(operation)
+    
+    return [operation for operation in folded if operation is not None]
 
 
 class ImpactAnalyzer:
@@ -89,15 +344,19 @@ class ImpactAnalyzer:
             "operations_count": len(operations),
             "files_to_modify": [],
             "migration_changes": [],
-            "potential_risks": [],
+            # Collected as sets so repeated operations don't produce duplicate messages
+            "potential_risks": set(),
             "dependency_impacts": [],
-            "breaking_changes": [],
+            "breaking_changes": set(),
             "validation_results": []
         }
         
         for operation in operations:
             self._analyze_single_operation(analysis, service_info, operation)
         
+        analysis["potential_risks"] = sorted(analysis["potential_risks"])
+        analysis["breaking_changes"] = sorted(analysis["breaking_changes"])
+        
         # Determine files that will be modified
         analysis["files_to_modify"] = self._get_affected_files(service_info)
         
@@ -105,62 +364,19 @@ class ImpactAnalyzer:
     
     def _analyze_single_operation(self, analysis: Dict, service_info: Dict, operation: FieldOperation):
         """Analyze a single field operation."""
-        if operation.action == 'add':
-            field = operation.field_data['field']
-            analysis["migration_changes"].append({
-                "type": "ADD_COLUMN",
-                "field_name": field['name'],
-                "sql": f"ALTER TABLE {service_info['table']} ADD COLUMN {field['name']} {field['type']}"
-            })
-            
-            if not field.get('nullable', True) and 'default_value' not in field:
-                analysis["potential_risks"].append(
-                    f"Adding non-nullable field '{field['name']}' without default value may fail if table has data"
-                )
+        migration_change = operation.migration_change_for(service_info['table'])
+        if migration_change:
+            analysis["migration_changes"].append(migration_change)
         
-        elif operation.action == 'update':
-            field_name = operation.field_data['field_name']
-            changes = operation.field_data['changes']
-            
-            if 'type' in changes:
-                analysis["migration_changes"].append({
-                    "type": "MODIFY_COLUMN",
-                    "field_name": field_name,
-                    "sql": f"ALTER TABLE {service_info['table']} ALTER COLUMN {field_name} TYPE {changes['type']}"
-                })
-                
-                analysis["potential_risks"].append(
-                    f"Changing type of field '{field_name}' may cause data loss if incompatible"
-                )
-        
-        elif operation.action == 'remove':
-            field_name = operation.field_data['field_name']
-            analysis["migration_changes"].append({
-                "type": "DROP_COLUMN",
-                "field_name": field_name,
-                "sql": f"-- ALTER TABLE {service_info['table']} DROP COLUMN {field_name}; -- REQUIRES MANUAL CONFIRMATION"
-            })
-            
-            analysis["breaking_changes"].append(
-                f"Removing field '{field_name}' will break any code that references it"
-            )
+        analysis["potential_risks"].update(operation.risks)
+        analysis["breaking_changes"].update(operation.breaking_changes)
     
     def _get_affected_files(self, service_info: Dict) -> List[str]:
         """Get list of files that will be affected by field operations."""
         service_name = service_info['name']
         entity_name = service_info.get('entity', service_name.capitalize())
         
-        return [
-            f"src/main/java/com/vira/{service_name}/model/{entity_name}.java",
-            f"src/main/java/com/vira/{service_name}/dto/{entity_name}Request.java",
-            f"src/main/java/com/vira/{service_name}/dto/{entity_name}Response.java",
-            f"src/main/java/com/vira/{service_name}/service/{entity_name}Service.java",
-            f"src/main/java/com/vira/{service_name}/repository/{entity_name}Repository.java",
-            f"src/main/java/com/vira/{service_name}/controller/{entity_name}Controller.java",
-            f"src/test/java/com/vira/{service_name}/service/{entity_name}ServiceTest.java",
-            f"src/test/java/com/vira/{service_name}/controller/{entity_name}ControllerTest.java",
-            f"src/main/resources/frontend/api/{entity_name.lower()}ApiService.js"
-        ]
+        return list(_affected_files(service_name, entity_name))
 
 
 class BackupManager:
@@ -170,11 +386,16 @@ class BackupManager:
         self.logger = logger
         self.backup_base_dir = Path("backups")
         self.backup_base_dir.mkdir(exist_ok=True)
+        # Most recent manifest per service, used to hard link unchanged files
+        self._latest_manifests: Dict[str, Dict[str, Any]] = {}
     
     def create_backup(self, service_name: str, project_root: Path) -> str:
         """
         Create a backup of all files that will be modified.
         
+        Files unchanged since the previous backup of the same service
+        (same mtime and size) are hard linked instead of copied.
+        
         Args:
             service_name: Name of the service being modified
             project_root: Root path of the Vira Services project
@@ -190,6 +411,8 @@ class BackupManager:
         
         try:
             backup_dir.mkdir(parents=True)
+            previous_manifest = self._find_previous_manifest(service_name, project_root)
+            file_stats: Dict[str, List[int]] = {}
             
             # Files to backup based on service structure
             files_to_backup = [
@@ -205,11 +428,13 @@ class BackupManager:
                     if source_path.is_dir():
                         dest_path = backup_dir / file_path
                         dest_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copytree(source_path, dest_path, dirs_exist_ok=True)
+                        self._fast_copytree(source_path, dest_path, file_path, file_stats, previous_manifest)
                     else:
                         dest_path = backup_dir / file_path
                         dest_path.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(source_path, dest_path)
+                        source_stat = source_path.stat()
+                        file_stats[file_path] = [source_stat.st_mtime_ns, source_stat.st_size]
+                        self._backup_file(str(source_path), str(dest_path), file_path, file_stats, previous_manifest)
             
             # Create backup manifest
             manifest = {
@@ -217,12 +442,14 @@ class BackupManager:
                 "service_name": service_name,
                 "timestamp": timestamp,
                 "files_backed_up": files_to_backup,
-                "project_root": str(project_root)
+                "project_root": str(project_root),
+                "file_stats": file_stats
             }
             
             with open(backup_dir / "manifest.json", 'w') as f:
                 json.dump(manifest, f, indent=2)
             
+            self._latest_manifests[service_name] = manifest
             self.logger.info(f"✅ Backup created successfully: {backup_id}")
             return backup_id
             
@@ -232,6 +459,113 @@ class BackupManager:
                 shutil.rmtree(backup_dir)
             raise
     
+    def _find_previous_manifest(self, service_name: str, project_root: Path) -> Optional[Dict[str, Any]]:
+        """Find the most recent backup manifest of a service that records file stats."""
+        manifest = self._latest_manifests.get(service_name)
+        if manifest is None:
+            manifest = next(
+                (backup for backup in self.list_backups()
+                 if backup.get('service_name') == service_name and 'file_stats' in backup),
+                None
+            )
+        
+        if manifest is None or manifest.get('project_root') != str(project_root):
+            return None
+        if not (self.backup_base_dir / manifest['backup_id']).exists():
+            return None
+        return manifest
+    
+    def _fast_copytree(self, source_dir: Path, dest_dir: Path, relative_dir: str,
+                       file_stats: Dict[str, List[int]], previous_manifest: Optional[Dict[str, Any]]) -> None:
+        """Copy a directory tree using the fastest copy mechanism available."""
+        copy_jobs = []
+        pending_dirs = [(str(source_dir), str(dest_dir), relative_dir)]
+        
+        while pending_dirs:
+            source, dest, relative = pending_dirs.pop()
+            os.makedirs(dest, exist_ok=True)
+            with os.scandir(source) as entries:
+                for entry in entries:
+                    target = os.path.join(dest, entry.name)
+                    relative_path = f"{relative}/{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append((entry.path, target, relative_path))
+                    elif entry.is_file():
+                        entry_stat = entry.stat()
+                        file_stats[relative_path] = [entry_stat.st_mtime_ns, entry_stat.st_size]
+                        copy_jobs.append((entry.path, target, relative_path))
+        
+        # robocopy is much faster than a per-file Python loop for large trees on Windows
+        if sys.platform == 'win32' and len(copy_jobs) > ROBOCOPY_MIN_FILES:
+            result = subprocess.run(
+                ['robocopy', str(source_dir), str(dest_dir), '/E',
+                 '/NFL', '/NDL', '/NJH', '/NJS', '/NP', '/MT:16'],
+                capture_output=True
+            )
+            # robocopy exit codes below 8 indicate success
+            if result.returncode < 8:
+                return
+            self.logger.warning(f"⚠️  robocopy failed (exit code {result.returncode}), falling back to file copy")
+        
+        if copy_jobs:
+            # File copies are I/O bound and release the GIL, so copy in parallel
+            with ThreadPoolExecutor(max_workers=BACKUP_COPY_WORKERS) as executor:
+                # Consume the results so any copy error is raised here
+                list(executor.map(
+                    lambda job: self._backup_file(*job, file_stats, previous_manifest),
+                    copy_jobs
+                ))
+    
+    def _backup_file(self, source: str, target: str, relative_path: str,
+                     file_stats: Dict[str, List[int]], previous_manifest: Optional[Dict[str, Any]]) -> None:
+        """Back up one file, hard linking it from the previous backup when unchanged."""
+        if previous_manifest and previous_manifest['file_stats'].get(relative_path) == file_stats[relative_path]:
+            previous_file = self.backup_base_dir / previous_manifest['backup_id'] / relative_path
+            try:
+                os.link(previous_file, target)
+                return
+            except OSError:
+                # Missing previous copy or no hard link support: fall back to a full copy
+                pass
+        
+        self._copy_file(source, target)
+    
+    @staticmethod
+    def _copy_file(source: str, target: str) -> None:
+        """Copy a single file with metadata, preferring reflink and sendfile."""
+        with open(source, 'rb') as fsrc, open(target, 'wb') as fdst:
+            copied = False
+            
+            # Copy-on-write clone: near-instant on btrfs/XFS
+            if fcntl is not None:
+                try:
+                    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                    copied = True
+                except OSError:
+                    pass
+            
+            # Zero-copy transfer inside the kernel
+            if not copied and hasattr(os, 'sendfile') and sys.platform.startswith('linux'):
+                try:
+                    size = os.fstat(fsrc.fileno()).st_size
+                    offset = 0
+                    while offset < size:
+                        sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                    copied = offset >= size
+                except OSError:
+                    copied = False
+            
+            if not copied:
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+        
+        shutil.copystat(source, target)
+    
     def restore_backup(self, backup_id: str) -> bool:
         """
         Restore files from a backup.
@@ -250,8 +584,7 @@ class BackupManager:
         
         try:
             # Load backup manifest
-            with open(backup_dir / "manifest.json", 'r') as f:
-                manifest = json.load(f)
+            manifest = _load_json(backup_dir / "manifest.json")
             
             project_root = Path(manifest['project_root'])
             self.logger.info(f"🔄 Restoring backup: {backup_id}")
@@ -280,18 +613,17 @@ class BackupManager:
         """List all available backups."""
         backups = []
         
-        for backup_dir in self.backup_base_dir.iterdir():
-            if backup_dir.is_dir():
-                manifest_file = backup_dir / "manifest.json"
-                if manifest_file.exists():
-                    try:
-                        with open(manifest_file, 'r') as f:
-                            manifest = json.load(f)
-                        backups.append(manifest)
-                    except Exception:
-                        continue
-        
-        return sorted(backups, key=lambda x: x['timestamp'], reverse=True)
+        with os.scandir(self.backup_base_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                try:
+                    backups.append(_load_json(os.path.join(entry.path, "manifest.json")))
+                except (OSError, ValueError):
+                    # No manifest or an unreadable/corrupt one: not a usable backup
+                    continue
+        
+        return sorted(backups, key=itemgetter('timestamp'), reverse=True)
 
 
 class DependencyChecker:
@@ -299,6 +631,10 @@ class DependencyChecker:
     
     def __init__(self, logger: logging.Logger):
         self.logger = logger
+        # Directory listings keyed by (directory, extensions), reused across field checks
+        self._file_list_cache: Dict[Tuple[str, Tuple[str, ...]], List[Tuple[str, int]]] = {}
+        # Foreign key references keyed by migration directory
+        self._foreign_key_index_cache: Dict[str, Set[Tuple[bytes, bytes]]] = {}
     
     def check_field_usage(self, service_name: str, field_name: str, project_root: Path) -> Dict[str, List[str]]:
         """
@@ -322,31 +658,36 @@ class DependencyChecker:
             "potential_issues": []
         }
         
-        # Convert field name to different naming conventions
-        camel_case = self._to_camel_case(field_name)
-        pascal_case = self._to_pascal_case(field_name)
-        
-        search_patterns = [field_name, camel_case, pascal_case]
+        # Match the snake_case, camelCase and PascalCase variants in a single scan per file
+        search_regex = self._compile_search_patterns(_name_variants(field_name))
         
-        # Search in Java files
-        java_dir = project_root / "src" / "main" / "java" / "com" / "vira" / service_name
-        if java_dir.exists():
-            usage["java_files"] = self._search_in_directory(java_dir, search_patterns, [".java"])
+        # Java, test and frontend files share the same patterns, so search them in one pass
+        search_targets = {
+            "java_files": (project_root / "src" / "main" / "java" / "com" / "vira" / service_name, JAVA_EXTENSIONS),
+            "test_files": (project_root / "src" / "test" / "java" / "com" / "vira" / service_name, JAVA_EXTENSIONS),
+            "frontend_files": (project_root / "src" / "main" / "resources" / "frontend", FRONTEND_EXTENSIONS)
+        }
         
-        # Search in test files
-        test_dir = project_root / "src" / "test" / "java" / "com" / "vira" / service_name
-        if test_dir.exists():
-            usage["test_files"] = self._search_in_directory(test_dir, search_patterns, [".java"])
+        candidates = []
+        for category, (directory, extensions) in search_targets.items():
+            if directory.exists():
+                base_prefix_len = self._base_prefix_length(directory)
+                candidates.extend(
+                    (category, file_path, file_size, base_prefix_len)
+                    for file_path, file_size in self._list_files(directory, extensions)
+                )
         
-        # Search in frontend files
-        frontend_dir = project_root / "src" / "main" / "resources" / "frontend"
-        if frontend_dir.exists():
-            usage["frontend_files"] = self._search_in_directory(frontend_dir, search_patterns, [".js", ".ts"])
+        matches = {category: set() for category in search_targets}
+        for category, relative_path in self._match_files(candidates, search_regex):
+            matches[category].add(relative_path)
+        for category, category_matches in matches.items():
+            usage[category] = sorted(category_matches)
         
         # Search in migration files
         migration_dir = project_root / "src" / "main" / "resources" / "db" / "migration"
         if migration_dir.exists():
-            usage["migration_files"] = self._search_in_directory(migration_dir, [field_name], [".sql"])
+            migration_regex = self._compile_search_patterns([field_name])
+            usage["migration_files"] = self._search_in_directory(migration_dir, migration_regex, SQL_EXTENSIONS)
         
         return usage
     
@@ -390,24 +731,88 @@ class DependencyChecker:
         
         return errors
     
-    def _search_in_directory(self, directory: Path, patterns: List[str], extensions: List[str]) -> List[str]:
-        """Search for patterns in files within a directory."""
-        matches = []
+    @staticmethod
+    def _compile_search_patterns(patterns: List[str]) -> re.Pattern:
+        """Compile literal search patterns into a single bytes alternation regex."""
+        unique_patterns = dict.fromkeys(pattern.encode('utf-8') for pattern in patterns)
+        return re.compile(b'|'.join(re.escape(pattern) for pattern in unique_patterns))
+    
+    def _list_files(self, directory: Path, extensions: Tuple[str, ...]) -> List[Tuple[str, int]]:
+        """List (path, size) of files under a directory with one of the given extensions (cached)."""
+        cache_key = (str(directory), extensions)
+        if cache_key in self._file_list_cache:
+            return self._file_list_cache[cache_key]
         
-        for file_path in directory.rglob("*"):
-            if file_path.is_file() and file_path.suffix in extensions:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        for pattern in patterns:
-                            if pattern in content:
-                                relative_path = file_path.relative_to(directory.parent.parent.parent.parent)
-                                matches.append(str(relative_path))
-                                break
-                except Exception:
-                    continue
+        files = []
+        pending_dirs = [str(directory)]
+        
+        while pending_dirs:
+            try:
+                with os.scandir(pending_dirs.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending_dirs.append(entry.path)
+                        elif entry.name.endswith(extensions) and entry.is_file():
+                            files.append((entry.path, entry.stat().st_size))
+            except OSError:
+                continue
         
-        return matches
+        files.sort()
+        self._file_list_cache[cache_key] = files
+        return files
+    
+    def _search_in_directory(self, directory: Path, search_regex: re.Pattern, extensions: Tuple[str, ...]) -> List[str]:
+        """Search for a compiled pattern in files within a directory."""
+        base_prefix_len = self._base_prefix_length(directory)
+        candidates = [
+            (None, file_path, file_size, base_prefix_len)
+            for file_path, file_size in self._list_files(directory, extensions)
+        ]
+        return sorted({relative_path for _, relative_path in self._match_files(candidates, search_regex)})
+    
+    @staticmethod
+    def _base_prefix_length(directory: Path) -> int:
+        """Length of the prefix to strip from listed paths to make them relative to the reporting base."""
+        # Matches are reported relative to the fourth ancestor of the searched directory
+        base_dir = str(directory.parent.parent.parent.parent)
+        if base_dir == '.':
+            return 0
+        return len(os.path.join(base_dir, ''))
+    
+    def _match_files(self, candidates: List[Tuple[Optional[str], str, int, int]],
+                     search_regex: re.Pattern) -> Iterator[Tuple[Optional[str], str]]:
+        """
+        Scan candidate files for a compiled pattern.
+        
+        Args:
+            candidates: (category, path, size, base prefix length) for each file to scan
+            search_regex: Compiled bytes pattern to look for
+            
+        Yields:
+            (category, path relative to its base directory) for each matching file
+        """
+        # Shared buffer for small files, so they need one unbuffered read and no allocation
+        small_file_buffer = bytearray(SMALL_FILE_SIZE_LIMIT)
+        small_file_view = memoryview(small_file_buffer)
+        
+        for category, file_path, file_size, base_prefix_len in candidates:
+            try:
+                with open(file_path, 'rb', buffering=0) as f:
+                    if file_size < SMALL_FILE_SIZE_LIMIT:
+                        bytes_read = f.readinto(small_file_buffer)
+                        # A file that grew past the buffer since listing is mapped instead
+                        if bytes_read < SMALL_FILE_SIZE_LIMIT:
+                            if search_regex.search(small_file_view[:bytes_read]):
+                                yield category, file_path[base_prefix_len:]
+                            continue
+                    
+                    # Memory-map larger files so matching runs on raw bytes without decoding
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if search_regex.search(mm):
+                            yield category, file_path[base_prefix_len:]
+            except (OSError, ValueError):
+                # Unreadable or empty files (empty files cannot be mapped)
+                continue
     
     def _is_primary_key(self, field_name: str, service_info: Dict, project_root: Path) -> bool:
         """Check if a field is a primary key."""
@@ -422,19 +827,26 @@ class DependencyChecker:
         if not migration_dir.exists():
             return False
         
-        table_name = service_info['table']
-        reference_pattern = f"REFERENCES {table_name}({field_name})"
-        
-        for migration_file in migration_dir.glob("*.sql"):
+        reference = (service_info['table'].encode('utf-8'), field_name.encode('utf-8'))
+        return reference in self._get_foreign_key_index(migration_dir)
+    
+    def _get_foreign_key_index(self, migration_dir: Path) -> Set[Tuple[bytes, bytes]]:
+        """Collect all (table, column) pairs referenced by foreign keys in the migrations (cached)."""
+        cache_key = str(migration_dir)
+        if cache_key in self._foreign_key_index_cache:
+            return self._foreign_key_index_cache[cache_key]
+        
+        references = set()
+        for migration_file, _ in self._list_files(migration_dir, SQL_EXTENSIONS):
             try:
-                with open(migration_file, 'r') as f:
-                    content = f.read()
-                    if reference_pattern in content:
-                        return True
-            except Exception:
+                with open(migration_file, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        references.update(match.groups() for match in FOREIGN_KEY_REFERENCE_PATTERN.finditer(mm))
+            except (OSError, ValueError):
                 continue
         
-        return False
+        self._foreign_key_index_cache[cache_key] = references
+        return references
     
     def _is_type_change_safe(self, field_name: str, new_type: str, service_info: Dict, project_root: Path) -> bool:
         """Check if a type change is safe (simplified implementation)."""
@@ -444,17 +856,8 @@ class DependencyChecker:
             return True  # VARCHAR changes are generally safe if expanding
         return False  # Conservative approach for other types
     
-    @staticmethod
-    def _to_camel_case(snake_str: str) -> str:
-        """Convert snake_case to camelCase."""
-        components = snake_str.split('_')
-        return components[0] + ''.join(word.capitalize() for word in components[1:])
-    
-    @staticmethod
-    def _to_pascal_case(snake_str: str) -> str:
-        """Convert snake_case to PascalCase."""
-        components = snake_str.split('_')
-        return ''.join(word.capitalize() for word in components)
+    _to_camel_case = staticmethod(_to_camel_case)
+    _to_pascal_case = staticmethod(_to_pascal_case)
 
 
 class ConfirmationManager:
@@ -552,6 +955,11 @@ class FieldModifier:
         self.config = None
         self.logger = None
         self.project_root = None
+        self._file_updater = None
+        self._next_migration_version = None
+        self._java_base_cache: Dict[Tuple[str, str], Path] = {}
+        self._run_timestamp = None
+        self.parallel_updates = True
         
         # Initialize components
         self._setup_logging()
@@ -570,22 +978,14 @@ class FieldModifier:
         
         self.logger = logging.getLogger("FieldModifier")
         self.logger.setLevel(logging.DEBUG)
+        for handler in self.logger.handlers:
+            handler.close()
         self.logger.handlers.clear()
         
         # Console handler with colors
         console_handler = colorlog.StreamHandler()
         console_handler.setLevel(logging.INFO)
-        console_formatter = colorlog.ColoredFormatter(
-            '%(log_color)s%(levelname)-8s%(reset)s %(blue)s%(message)s',
-            log_colors={
-                'DEBUG': 'cyan',
-                'INFO': 'green',
-                'WARNING': 'yellow',
-                'ERROR': 'red',
-                'CRITICAL': 'red,bg_white',
-            }
-        )
-        console_handler.setFormatter(console_formatter)
+        console_handler.setFormatter(CONSOLE_LOG_FORMATTER)
         self.logger.addHandler(console_handler)
         
         # File handler
@@ -594,10 +994,7 @@ class FieldModifier:
             encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
-        )
-        file_handler.setFormatter(file_formatter)
+        file_handler.setFormatter(FILE_LOG_FORMATTER)
         self.logger.addHandler(file_handler)
         
         self.logger.info("🔧 Field Modifier initialized")
@@ -605,8 +1002,7 @@ class FieldModifier:
     def _load_configuration(self) -> None:
         """Load configuration from config file."""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                self.config = json.load(file)
+            self.config = _load_json(self.config_path)
             
             self.project_root = Path(self.config['paths']['vira_services_root'])
             
@@ -620,31 +1016,42 @@ class FieldModifier:
                 self.logger.error(f"❌ Failed to load configuration: {str(e)}")
             raise
     
-    def process_field_operations(self, operations_file: str) -> bool:
+    def process_field_operations(self, operations_source: Union[str, Dict[str, Any]]) -> bool:
         """
-        Process field operations from a JSON file.
+        Process field operations from a JSON file or already-parsed operations data.
         
         Args:
-            operations_file: Path to the field operations JSON file
+            operations_source: Path to the field operations JSON file, or its parsed contents
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            self.logger.info(f"📖 Processing field operations from: {operations_file}")
-            
-            # Load operations file
-            with open(operations_file, 'r', encoding='utf-8') as f:
-                operations_data = json.load(f)
+            if isinstance(operations_source, dict):
+                self.logger.info("📖 Processing field operations from parsed data")
+                operations_data = operations_source
+            else:
+                self.logger.info(f"📖 Processing field operations from: {operations_source}")
+                
+                # Load operations file
+                operations_data = _load_json(operations_source)
             
             # Validate operations file
             self._validate_operations_file(operations_data)
             
             # Parse operations
             service_info = operations_data['target_service']
-            field_operations = [FieldOperation(op['action'], op) for op in operations_data['field_operations']]
+            requested_operations = [FieldOperation(op['action'], op) for op in operations_data['field_operations']]
             options = operations_data.get('options', {})
             
+            # Fold once, so the analysis, the confirmation, the file updates and the migration all see the same operations
+            field_operations = fold_field_operations(requested_operations)
+            if len(field_operations) != len(requested_operations):
+                self.logger.info(f"Folded {len(requested_operations)} operations into {len(field_operations)}")
+            if not field_operations:
+                self.logger.info("✅ The field operations cancel each other out; nothing to apply")
+                return True
+            
             # Analyze impact
             analysis = self.impact_analyzer.analyze_field_operations(service_info, field_operations)
             
@@ -726,34 +1133,33 @@ class FieldModifier:
         self.logger.info("🔧 Applying field operations...")
         
         try:
-            # Import file updater
-            from file_updater import JavaFileUpdater
-            file_updater = JavaFileUpdater(self.logger)
-            file_updater.setup_templates()
-            
-            # 1. Generate migration file
-            self._generate_migration_file(service_info, operations, analysis)
-            
-            # 2. Update model files
-            self._update_model_files(service_info, operations, file_updater)
+            file_updater = self.file_updater
             
-            # 3. Update DTO files
-            self._update_dto_files(service_info, operations, file_updater)
+            # Stamp every file generated in this run with the same time
+            self._run_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             
-            # 4. Update service files
-            self._update_service_files(service_info, operations, file_updater)
+            # Resolve the entity name once and hand it to every update step below
+            entity_name = service_info.get('entity', service_info['name'].capitalize())
             
-            # 5. Update repository files
-            self._update_repository_files(service_info, operations)
-            
-            # 6. Update controller files
-            self._update_controller_files(service_info, operations)
-            
-            # 7. Update test files
-            self._update_test_files(service_info, operations)
+            # 1. Generate migration file
+            self._generate_migration_file(service_info, operations, analysis)
             
-            # 8. Generate React files
-            self._update_react_files(service_info, operations)
+            # 2-7. Update model, DTO, service, repository, test and React files.
+            # Each step touches its own files, so they can run concurrently. Controllers
+            # only exchange DTOs, so the DTO changes already cover the API contract.
+            update_steps = [
+                (self._update_model_files, (service_info, entity_name, operations, file_updater)),
+                (self._update_dto_files, (service_info, entity_name, operations, file_updater)),
+                (self._update_service_files, (service_info, entity_name, operations, file_updater)),
+                (self._update_repository_files, (service_info, entity_name, operations)),
+                (self._update_test_files, (service_info, entity_name, operations)),
+                (self._update_react_files, (service_info, entity_name, operations)),
+            ]
+            if self.parallel_updates:
+                self._run_update_steps_parallel(update_steps)
+            else:
+                for step, args in update_steps:
+                    step(*args)
             
             self.logger.info("✅ All field operations applied successfully")
             
@@ -761,6 +1167,37 @@ class FieldModifier:
             self.logger.error(f"❌ Failed to apply field operations: {str(e)}")
             raise
     
+    def _java_base(self, service_info: Dict, source_set: str = "main") -> Path:
+        """Return the service's Java package directory for a source set, computed once per service."""
+        key = (source_set, service_info['name'])
+        base = self._java_base_cache.get(key)
+        if base is None:
+            base = self.project_root.joinpath("src", source_set, "java", "com", "vira", service_info['name'])
+            self._java_base_cache[key] = base
+        return base
+    
+    def _run_update_steps_parallel(self, update_steps: List[Tuple[Any, Tuple]]) -> None:
+        """Run update steps on a thread pool, stopping queued steps after the first failure."""
+        with ThreadPoolExecutor(max_workers=UPDATE_WORKERS) as executor:
+            futures = [executor.submit(step, *args) for step, args in update_steps]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+        
+        # Re-raise the first failure in step order
+        for future in futures:
+            if not future.cancelled():
+                future.result()
+    
+    @property
+    def file_updater(self):
+        """Java file updater, created on first use and then reused across runs."""
+        if self._file_updater is None:
+            # Imported lazily so that runs which never apply changes don't load it
+            from file_updater import JavaFileUpdater
+            self._file_updater = JavaFileUpdater(self.logger)
+        return self._file_updater
+    
     def _generate_migration_file(self, service_info: Dict, operations: List[FieldOperation], analysis: Dict) -> None:
         """Generate database migration file for field operations."""
         self.logger.info("📝 Generating migration file...")
@@ -770,24 +1207,22 @@ class FieldModifier:
             migration_dir = self.project_root / "src" / "main" / "resources" / "db" / "migration"
             migration_dir.mkdir(parents=True, exist_ok=True)
             
-            # Find next migration version
-            existing_migrations = list(migration_dir.glob("V*.sql"))
-            if existing_migrations:
-                version_numbers = []
-                for migration in existing_migrations:
-                    match = re.match(r'V(\d+)__.*\.sql', migration.name)
-                    if match:
-                        version_numbers.append(int(match.group(1)))
-                next_version = max(version_numbers) + 1 if version_numbers else 1
-            else:
-                next_version = 1
+            # Find next migration version (scanned once, then tracked on the instance)
+            if self._next_migration_version is None:
+                self._next_migration_version = self._scan_next_migration_version(migration_dir)
             
-            migration_version = f"V{next_version}"
+            migration_version = f"V{self._next_migration_version}"
             
-            # Categorize operations
-            add_operations = [op for op in operations if op.action == "add"]
-            update_operations = [op for op in operations if op.action == "update"]
-            remove_operations = [op for op in operations if op.action == "remove"]
+            # Categorize operations in a single pass, bucketed by action
+            buckets = defaultdict(list)
+            fields_with_updated_at = False
+            for op in operations:
+                buckets[op.action].append(op)
+                if op.action == "add" and op.field_name == "updated_at":
+                    fields_with_updated_at = True
+            add_operations = buckets["add"]
+            update_operations = buckets["update"]
+            remove_operations = buckets["remove"]
             
             # Generate operations summary
             op_counts = []
@@ -803,31 +1238,30 @@ class FieldModifier:
             # Setup Jinja2 environment
             templates_dir = Path("templates/field_operations")
             if templates_dir.exists():
-                from jinja2 import Environment, FileSystemLoader
-                jinja_env = Environment(loader=FileSystemLoader(str(templates_dir)))
-                template = jinja_env.get_template("migration_alter.sql.j2")
-                
-                # Render migration
-                migration_content = template.render(
-                    migration_version=migration_version,
-                    service_name=service_info['name'],
-                    table_name=service_info['table'],
-                    service_description=service_info.get('description', f"{service_info['name']} service"),
-                    operations_summary=operations_summary,
-                    generation_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    add_operations=add_operations,
-                    update_operations=update_operations,
-                    remove_operations=remove_operations,
-                    fields_with_updated_at=any(op.field_data.get("field", {}).get("name") == "updated_at" 
-                                             for op in add_operations)
-                )
+                template = _get_migration_template(str(templates_dir))
                 
-                # Write migration file
                 migration_filename = f"{migration_version}__Update_{service_info['name']}_{service_info['table']}_fields.sql"
                 migration_path = migration_dir / migration_filename
                 
-                with open(migration_path, 'w', encoding='utf-8') as f:
-                    f.write(migration_content)
+                # Render migration straight into the file
+                try:
+                    template.stream(
+                        migration_version=migration_version,
+                        service_name=service_info['name'],
+                        table_name=service_info['table'],
+                        service_description=service_info.get('description', f"{service_info['name']} service"),
+                        operations_summary=operations_summary,
+                        generation_date=self._run_timestamp,
+                        add_operations=add_operations,
+                        update_operations=update_operations,
+                        remove_operations=remove_operations,
+                        fields_with_updated_at=fields_with_updated_at
+                    ).dump(str(migration_path), encoding='utf-8')
+                except Exception:
+                    # Don't leave a half-written migration behind for Flyway to pick up
+                    migration_path.unlink(missing_ok=True)
+                    raise
+                self._next_migration_version += 1
                 
                 self.logger.info(f"✅ Migration file generated: {migration_filename}")
             else:
@@ -837,12 +1271,25 @@ class FieldModifier:
             self.logger.error(f"❌ Failed to generate migration: {str(e)}")
             raise
     
-    def _update_model_files(self, service_info: Dict, operations: List[FieldOperation], file_updater) -> None:
+    @staticmethod
+    def _scan_next_migration_version(migration_dir: Path) -> int:
+        """Find the version number following the highest existing migration."""
+        with os.scandir(migration_dir) as entries:
+            names = [entry.name for entry in entries
+                     if entry.name.startswith('V') and entry.name.endswith('.sql')]
+        
+        version_numbers = []
+        for name in names:
+            match = MIGRATION_VERSION_PATTERN.match(name)
+            if match:
+                version_numbers.append(int(match.group(1)))
+        return max(version_numbers) + 1 if version_numbers else 1
+    
+    def _update_model_files(self, service_info: Dict, entity_name: str, operations: List[FieldOperation], file_updater) -> None:
         """Update JPA model files."""
         self.logger.info("🏗️  Updating model files...")
         
-        entity_name = service_info.get('entity', service_info['name'].capitalize())
-        model_path = self.project_root / "src" / "main" / "java" / "com" / "vira" / service_info['name'] / "model" / f"{entity_name}.java"
+        model_path = self._java_base(service_info) / "model" / f"{entity_name}.java"
         
         if model_path.exists():
             success = file_updater.update_model_file(model_path, operations, service_info)
@@ -853,12 +1300,11 @@ class FieldModifier:
         else:
             self.logger.warning(f"⚠️  Model file not found: {model_path}")
     
-    def _update_dto_files(self, service_info: Dict, operations: List[FieldOperation], file_updater) -> None:
+    def _update_dto_files(self, service_info: Dict, entity_name: str, operations: List[FieldOperation], file_updater) -> None:
         """Update DTO files."""
         self.logger.info("📦 Updating DTO files...")
         
-        entity_name = service_info.get('entity', service_info['name'].capitalize())
-        dto_dir = self.project_root / "src" / "main" / "java" / "com" / "vira" / service_info['name'] / "dto"
+        dto_dir = self._java_base(service_info) / "dto"
         
         request_path = dto_dir / f"{entity_name}Request.java"
         response_path = dto_dir / f"{entity_name}Response.java"
@@ -872,12 +1318,11 @@ class FieldModifier:
         else:
             self.logger.warning("⚠️  DTO files not found")
     
-    def _update_service_files(self, service_info: Dict, operations: List[FieldOperation], file_updater) -> None:
+    def _update_service_files(self, service_info: Dict, entity_name: str, operations: List[FieldOperation], file_updater) -> None:
         """Update service files."""
         self.logger.info("⚙️  Updating service files...")
         
-        entity_name = service_info.get('entity', service_info['name'].capitalize())
-        service_path = self.project_root / "src" / "main" / "java" / "com" / "vira" / service_info['name'] / "service" / f"{entity_name}Service.java"
+        service_path = self._java_base(service_info) / "service" / f"{entity_name}Service.java"
         
         if service_path.exists():
             success = file_updater.update_service_file(service_path, operations, service_info)
@@ -888,129 +1333,113 @@ class FieldModifier:
         else:
             self.logger.warning(f"⚠️  Service file not found: {service_path}")
     
-    def _update_repository_files(self, service_info: Dict, operations: List[FieldOperation]) -> None:
+    def _update_repository_files(self, service_info: Dict, entity_name: str, operations: List[FieldOperation]) -> None:
         """Update repository files."""
         self.logger.info("🗃️  Updating repository files...")
         
         # Repository interfaces typically don't need updates for simple field additions
         # Custom queries might need updates for new fields
         
-        entity_name = service_info.get('entity', service_info['name'].capitalize())
-        repo_path = self.project_root / "src" / "main" / "java" / "com" / "vira" / service_info['name'] / "repository" / f"{entity_name}Repository.java"
+        # Only new String fields short enough to search on get finder methods
+        eligible = [
+            op for op in operations
+            if op.action == "add"
+            and op.field_data["field"].get("javaType") == "String"
+            and op.field_data["field"].get("validation", {}).get("maxLength", 0) <= 255
+        ]
+        if not eligible:
+            self.logger.info("ℹ️  No repository updates needed")
+            return
+        
+        repo_path = self._java_base(service_info) / "repository" / f"{entity_name}Repository.java"
         
         if repo_path.exists():
             # Add custom query methods for new searchable fields
             try:
-                with open(repo_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = repo_path.read_text(encoding='utf-8')
                 
                 # Add finder methods for new string fields
                 new_methods = []
-                for operation in operations:
-                    if operation.action == "add":
-                        field_data = operation.field_data["field"]
-                        if (field_data["javaType"] == "String" and 
-                            field_data.get("validation", {}).get("maxLength", 0) <= 255):
-                            
-                            field_name = field_data["name"]
-                            pascal_case = self._to_pascal_case(field_name)
-                            
-                            method = f"""
-    /**
-     * Find {entity_name.lower()}s by {field_name.replace('_', ' ')}.
-     * 
-     * @param {self._to_camel_case(field_name)} the {field_name.replace('_', ' ')}
-     * @return list of {entity_name.lower()}s
-     */
-    List<{entity_name}> findBy{pascal_case}(String {self._to_camel_case(field_name)});
-    
-    /**
-     * Find {entity_name.lower()}s by {field_name.replace('_', ' ')} containing text (case-insensitive).
-     * 
-     * @param {self._to_camel_case(field_name)} the {field_name.replace('_', ' ')} to search for
-     * @return list of {entity_name.lower()}s
-     */
-    List<{entity_name}> findBy{pascal_case}ContainingIgnoreCase(String {self._to_camel_case(field_name)});
-"""
-                            new_methods.append(method)
+                render_method = REPOSITORY_METHOD_TEMPLATE.format
+                entity_context = {'entity': entity_name, 'entity_lower': entity_name.lower()}
+                for operation in eligible:
+                    new_methods.append(render_method(
+                        field_human=operation.display_name,
+                        pascal=operation.pascal_name,
+                        camel=operation.camel_name,
+                        **entity_context
+                    ))
                 
-                if new_methods:
-                    # Insert before the closing brace
-                    insert_pos = content.rfind('}')
-                    if insert_pos > 0:
-                        updated_content = content[:insert_pos] + '\n'.join(new_methods) + '\n' + content[insert_pos:]
-                        
-                        with open(repo_path, 'w', encoding='utf-8') as f:
-                            f.write(updated_content)
-                        
-                        self.logger.info("✅ Repository file updated with new query methods")
-                    else:
-                        self.logger.warning("⚠️  Could not find insertion point in repository file")
+                # Insert before the closing brace
+                head, brace, tail = content.rpartition('}')
+                if head:
+                    repo_path.write_text(''.join((head, *new_methods, brace, tail)), encoding='utf-8')
+                    
+                    self.logger.info("✅ Repository file updated with new query methods")
                 else:
-                    self.logger.info("ℹ️  No repository updates needed")
+                    self.logger.warning("⚠️  Could not find insertion point in repository file")
                     
             except Exception as e:
                 self.logger.warning(f"⚠️  Failed to update repository file: {str(e)}")
         else:
             self.logger.warning(f"⚠️  Repository file not found: {repo_path}")
     
-    def _update_controller_files(self, service_info: Dict, operations: List[FieldOperation]) -> None:
-        """Update controller files."""
-        self.logger.info("🌐 Updating controller files...")
-        
-        # Controllers typically don't need updates for field changes
-        # The DTO changes handle the API contract updates
-        
-        self.logger.info("ℹ️  Controller files use DTOs, no direct updates needed")
-    
-    def _update_test_files(self, service_info: Dict, operations: List[FieldOperation]) -> None:
+    def _update_test_files(self, service_info: Dict, entity_name: str, operations: List[FieldOperation]) -> None:
         """Update test files."""
         self.logger.info("🧪 Updating test files...")
         
+        # Only non-generated new fields need test data
+        eligible = [
+            op for op in operations
+            if op.action == "add" and not op.field_data["field"].get("autoGenerated", False)
+        ]
+        if not eligible:
+            self.logger.info("ℹ️  No test file updates needed")
+            return
+        
         # Update test data and validation tests
-        entity_name = service_info.get('entity', service_info['name'].capitalize())
-        test_dir = self.project_root / "src" / "test" / "java" / "com" / "vira" / service_info['name']
+        test_dir = self._java_base(service_info, "test")
         
         # Update service test
         service_test_path = test_dir / "service" / f"{entity_name}ServiceTest.java"
         if service_test_path.exists():
             try:
-                with open(service_test_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = service_test_path.read_text(encoding='utf-8')
                 
                 # Add test data for new fields
                 test_updates = []
-                for operation in operations:
-                    if operation.action == "add":
-                        field_data = operation.field_data["field"]
-                        if not field_data.get("autoGenerated", False):
-                            test_value = self._get_test_value(field_data)
-                            camel_case = self._to_camel_case(field_data["name"])
-                            pascal_case = self._to_pascal_case(field_data["name"])
-                            
-                            test_updates.append(f"        .{camel_case}({test_value})")
+                for operation in eligible:
+                    field_data = operation.field_data["field"]
+                    test_value = self._get_test_value(field_data)
+                    
+                    test_updates.append(f"        .{operation.camel_name}({test_value})")
                 
-                if test_updates:
-                    # This is a simplified update - in a full implementation,
-                    # you'd parse the test methods and update them properly
-                    self.logger.info("ℹ️  Test file updates identified (manual review recommended)")
-                else:
-                    self.logger.info("ℹ️  No test file updates needed")
+                # This is a simplified update - in a full implementation,
+                # you'd parse the test methods and update them properly
+                self.logger.info("ℹ️  Test file updates identified (manual review recommended)")
                     
             except Exception as e:
                 self.logger.warning(f"⚠️  Failed to update test file: {str(e)}")
         else:
             self.logger.warning(f"⚠️  Test file not found: {service_test_path}")
     
-    def _update_react_files(self, service_info: Dict, operations: List[FieldOperation]) -> None:
+    def _update_react_files(self, service_info: Dict, entity_name: str, operations: List[FieldOperation]) -> None:
         """Update React API service files."""
         self.logger.info("⚛️  Updating React files...")
         
+        # Only non-generated additions and removals change the frontend interface
+        if not any(
+            op.action == "remove"
+            or (op.action == "add" and not op.field_data["field"].get("autoGenerated", False))
+            for op in operations
+        ):
+            self.logger.info("ℹ️  No React file updates needed")
+            return
+        
         frontend_dir = self.project_root / "src" / "main" / "resources" / "frontend"
         if not frontend_dir.exists():
             frontend_dir.mkdir(parents=True, exist_ok=True)
         
-        entity_name = service_info.get('entity', service_info['name'].capitalize())
         api_service_path = frontend_dir / "api" / f"{entity_name.lower()}ApiService.js"
         
         # Generate updated React API service
@@ -1022,25 +1451,26 @@ class FieldModifier:
                 if operation.action == "add":
                     field_data = operation.field_data["field"]
                     if not field_data.get("autoGenerated", False):
-                        camel_case = self._to_camel_case(field_data["name"])
+                        camel_case = operation.camel_name
                         ts_type = self._java_to_typescript_type(field_data["javaType"])
                         required = "" if field_data.get("nullable", True) else ""
                         
                         interface_updates.append(f"  {camel_case}{required}: {ts_type};  // {field_data.get('description', '')}")
                 elif operation.action == "remove":
-                    field_name = operation.field_data["field_name"]
-                    camel_case = self._to_camel_case(field_name)
-                    interface_updates.append(f"  // REMOVED: {camel_case}")
+                    interface_updates.append(f"  // REMOVED: {operation.camel_name}")
             
             if interface_updates:
                 # Create a simple update file for manual integration
                 update_file_path = frontend_dir / f"{entity_name}_interface_updates.txt"
-                with open(update_file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"// Interface updates for {entity_name}\n")
-                    f.write(f"// Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                    f.write("// Add these fields to your TypeScript interfaces:\n\n")
-                    for update in interface_updates:
-                        f.write(update + "\n")
+                update_lines = [
+                    f"// Interface updates for {entity_name}",
+                    f"// Generated: {self._run_timestamp}",
+                    "",
+                    "// Add these fields to your TypeScript interfaces:",
+                    "",
+                    *interface_updates,
+                ]
+                update_file_path.write_text("\n".join(update_lines) + "\n", encoding='utf-8')
                 
                 self.logger.info(f"✅ React interface updates generated: {update_file_path.name}")
             else:
@@ -1055,43 +1485,14 @@ class FieldModifier:
         
         if java_type == "String":
             return f'"test_{field_data["name"]}"'
-        elif java_type == "Boolean":
-            return "true"
-        elif java_type in ["Integer", "Long"]:
-            return "1"
-        elif java_type == "BigDecimal":
-            return "new BigDecimal(\"100.00\")"
-        elif java_type == "LocalDateTime":
-            return "LocalDateTime.now()"
-        elif java_type == "LocalDate":
-            return "LocalDate.now()"
-        else:
-            return "null"
+        return JAVA_TEST_VALUES.get(java_type, "null")
     
     def _java_to_typescript_type(self, java_type: str) -> str:
         """Convert Java type to TypeScript type."""
-        mapping = {
-            "String": "string",
-            "Boolean": "boolean",
-            "Integer": "number",
-            "Long": "number",
-            "BigDecimal": "number",
-            "LocalDateTime": "string",
-            "LocalDate": "string"
-        }
-        return mapping.get(java_type, "any")
-    
-    @staticmethod
-    def _to_camel_case(snake_str: str) -> str:
-        """Convert snake_case to camelCase."""
-        components = snake_str.split('_')
-        return components[0] + ''.join(word.capitalize() for word in components[1:])
+        return JAVA_TO_TYPESCRIPT_TYPES.get(java_type, "any")
     
-    @staticmethod
-    def _to_pascal_case(snake_str: str) -> str:
-        """Convert snake_case to PascalCase."""
-        components = snake_str.split('_')
-        return ''.join(word.capitalize() for word in components)
+    _to_camel_case = staticmethod(_to_camel_case)
+    _to_pascal_case = staticmethod(_to_pascal_case)
 
 
 @click.command()
@@ -1099,7 +1500,8 @@ class FieldModifier:
 @click.option('--operations', '-o', required=True, help='Field operations JSON file')
 @click.option('--dry-run', is_flag=True, help='Show what would be changed without applying')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
-def main(config: str, operations: str, dry_run: bool, verbose: bool):
+@click.option('--no-parallel', is_flag=True, help='Apply file updates one at a time')
+def main(config: str, operations: str, dry_run: bool, verbose: bool, no_parallel: bool):
     """
     Vira Services Field Modifier
     
@@ -1113,25 +1515,18 @@ def main(config: str, operations: str, dry_run: bool, verbose: bool):
         if verbose:
             modifier.logger.setLevel(logging.DEBUG)
         
-        # Override dry-run if specified
+        if no_parallel:
+            modifier.parallel_updates = False
+        
+        # Override dry-run if specified, handing the parsed data over directly
         if dry_run:
-            with open(operations, 'r') as f:
-                ops_data = json.load(f)
+            ops_data = _load_json(operations)
             ops_data.setdefault('options', {})['dry_run'] = True
-            
-            temp_file = operations + ".tmp"
-            with open(temp_file, 'w') as f:
-                json.dump(ops_data, f, indent=2)
-            
-            operations = temp_file
+            operations = ops_data
         
         # Process field operations
         success = modifier.process_field_operations(operations)
         
-        # Clean up temp file
-        if dry_run and operations.endswith('.tmp'):
-            Path(operations).unlink()
-        
         if success:
             print("\n🎉 Field modification completed successfully!")
             sys.exit(0)
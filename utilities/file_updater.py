@@ -16,10 +16,20 @@ Version: 1.0.0
 
 import os
 import re
+import shutil
+import threading
 import logging
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
 from datetime import datetime
+from bisect import bisect_right
+from itertools import accumulate
+from functools import lru_cache, cached_property
+from operator import itemgetter
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 
 try:
     from jinja2 import Environment, FileSystemLoader, Template
@@ -27,15 +37,113 @@ except ImportError as e:
     print(f"ERROR: Missing required dependency: {e}")
     exit(1)
 
+# Patterns for the parts of a Java source file that the parser extracts
+PACKAGE_PATTERN = re.compile(r'package\s+([\w.]+);')
+PACKAGE_BYTES_PATTERN = re.compile(rb'package\s+([\w.]+);')
+# The package declaration leads the file, so it is looked for in this many raw bytes first
+PACKAGE_SEARCH_PREFIX = 4096
+IMPORT_PATTERN = re.compile(r'import\s+([\w.*]+);')
+CLASS_PATTERN = re.compile(r'public\s+class\s+(\w+)')
+FIELD_PATTERN = re.compile(r'private\s+(\w+(?:<.*?>)?)\s+(\w+);')
+METHOD_PATTERN = re.compile(r'public\s+(\w+(?:<.*?>)?)\s+(\w+)\s*\([^)]*\)')
+ANNOTATION_PATTERN = re.compile(r'@(\w+)(?:\([^)]*\))?')
+# Whole-buffer variants of the field and method patterns; whitespace never crosses a line break
+FIELD_LINE_PATTERN = re.compile(r'private[^\S\n]+(\w+(?:<.*?>)?)[^\S\n]+(\w+);')
+METHOD_LINE_PATTERN = re.compile(r'public[^\S\n]+(\w+(?:<.*?>)?)[^\S\n]+(\w+)[^\S\n]*\([^)\n]*\)')
+METHOD_DECLARATION_PATTERN = re.compile(
+    r'\s*(?:(?:public|protected|private|static|final|synchronized)\s+)+[\w<>\[\],.? ]+?\s+(\w+)\s*\('
+)
+# Parsed structures kept per parser, least recently used dropped first
+PARSE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=512)
+def _field_declaration_pattern(field_name: str) -> re.Pattern:
+    """Compile the pattern matching the private declaration of a named field."""
+    return re.compile(rf'private\s+\w+(?:<.*?>)?\s+{re.escape(field_name)};')
+
+# Java types for the SQL column types supported in field operations
+SQL_TO_JAVA_TYPES = MappingProxyType({
+    'BIGSERIAL': 'Long',
+    'BIGINT': 'Long',
+    'INTEGER': 'Integer',
+    'DECIMAL': 'BigDecimal',
+    'VARCHAR': 'String',
+    'TEXT': 'String',
+    'TIMESTAMP': 'LocalDateTime',
+    'DATE': 'LocalDate',
+    'BOOLEAN': 'Boolean'
+})
+
+
+@lru_cache(maxsize=4096)
+def _sql_to_java_type(sql_type: str) -> str:
+    """Convert SQL type to Java type."""
+    base_type = sql_type.partition('(')[0].upper()
+    return SQL_TO_JAVA_TYPES.get(base_type, 'String')
+
+
+@lru_cache(maxsize=4096)
+def _to_camel_case(snake_str: str) -> str:
+    """Convert snake_case to camelCase."""
+    components = snake_str.split('_')
+    return components[0] + ''.join(map(str.capitalize, components[1:]))
+
+
+@lru_cache(maxsize=4096)
+def _to_pascal_case(snake_str: str) -> str:
+    """Convert snake_case to PascalCase."""
+    components = snake_str.split('_')
+    return ''.join(map(str.capitalize, components))
+
+
+@lru_cache(maxsize=None)
+def _template_environment(templates_dir: str) -> Environment:
+    """Jinja2 environment for a templates directory, shared by every updater that uses it."""
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+
+
+@dataclass
+class FieldInfo:
+    """A field declaration found by the parser."""
+    # Declared by hand; dataclass(slots=True) needs Python 3.10
+    __slots__ = ('name', 'type', 'annotations', 'javadoc', 'line_number')
+    
+    name: str
+    type: str
+    annotations: List[str]
+    javadoc: List[str]
+    line_number: int
+
+
+@dataclass
+class MethodInfo:
+    """A public method declaration found by the parser."""
+    __slots__ = ('name', 'return_type', 'line_number', 'full_line')
+    
+    name: str
+    return_type: str
+    line_number: int
+    full_line: str
+
 
 class JavaFileParser:
     """Parses Java files to understand their structure."""
     
     def __init__(self):
-        self.class_pattern = re.compile(r'public\s+class\s+(\w+)')
-        self.field_pattern = re.compile(r'private\s+(\w+(?:<.*?>)?)\s+(\w+);')
-        self.method_pattern = re.compile(r'public\s+(\w+(?:<.*?>)?)\s+(\w+)\s*\([^)]*\)')
-        self.annotation_pattern = re.compile(r'@(\w+)(?:\([^)]*\))?')
+        self.class_pattern = CLASS_PATTERN
+        self.field_pattern = FIELD_PATTERN
+        self.method_pattern = METHOD_PATTERN
+        self.annotation_pattern = ANNOTATION_PATTERN
+        # Parsed structures by path, with the (mtime_ns, size) they were parsed at, so a file
+        # edited elsewhere is parsed again; the updaters also invalidate the files they write
+        self._cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+        # The DTO and update steps parse from worker threads
+        self._cache_lock = threading.Lock()
     
     def parse_java_file(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -47,38 +155,92 @@ class JavaFileParser:
         Returns:
             Dictionary containing file structure
         """
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
             return {"error": f"File not found: {file_path}"}
+        except Exception as e:
+            return {"error": f"Failed to parse file: {str(e)}"}
         
+        key = str(file_path)
+        file_stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] == file_stamp:
+                self._cache.move_to_end(key)
+                cached = entry[1]
+            else:
+                cached = None
+        
+        if cached is None:
+            cached = self._parse(file_path)
+            if "error" in cached:
+                return cached
+            with self._cache_lock:
+                self._cache[key] = (file_stamp, cached)
+                self._cache.move_to_end(key)
+                if len(self._cache) > PARSE_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        
+        # The updaters edit the lines in place, so each caller gets its own list
+        return {**cached, "lines": list(cached["lines"])}
+    
+    def invalidate(self, file_path: Path) -> None:
+        """Forget the parsed structure of a file that has just been written."""
+        with self._cache_lock:
+            self._cache.pop(str(file_path), None)
+    
+    def _parse(self, file_path: Path) -> Dict[str, Any]:
+        """Read and parse a Java file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # One bulk read and decode, without text-mode newline translation
+            raw = file_path.read_bytes()
+            content = raw.decode('utf-8')
             
+            # Lines are handled without their line endings; the file's own newline is kept
+            # so that rewritten files don't end up with mixed line endings
+            first_break = content.find('\n')
+            newline = '\r\n' if first_break > 0 and content[first_break - 1] == '\r' else '\n'
+            if newline != '\n':
+                content = content.replace(newline, '\n')
+            
+            # Split once; the line-based extractors share the lines and their stripped form
+            lines = content.split('\n')
+            stripped = [line.strip() for line in lines]
+            # Offset of each line's first character, to map regex matches back to line numbers
+            line_starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+            
+            # Only the lines are kept; the updaters edit those and rejoin them once
             structure = {
                 "file_path": str(file_path),
-                "content": content,
-                "lines": content.split('\n'),
-                "package": self._extract_package(content),
+                "lines": lines,
+                "newline": newline,
+                "package": self._extract_package(content, raw),
                 "imports": self._extract_imports(content),
                 "class_name": self._extract_class_name(content),
-                "fields": self._extract_fields(content),
-                "methods": self._extract_methods(content),
-                "annotations": self._extract_class_annotations(content)
+                "fields": self._extract_fields(content, line_starts, stripped),
+                "methods": self._extract_methods(content, line_starts, stripped),
+                "annotations": self._extract_class_annotations(lines, stripped)
             }
             
             return structure
             
+        except FileNotFoundError:
+            return {"error": f"File not found: {file_path}"}
         except Exception as e:
             return {"error": f"Failed to parse file: {str(e)}"}
     
-    def _extract_package(self, content: str) -> Optional[str]:
-        """Extract package declaration."""
-        match = re.search(r'package\s+([\w.]+);', content)
+    def _extract_package(self, content: str, raw: bytes = b'') -> Optional[str]:
+        """Extract package declaration, from the head of the raw bytes when it is there."""
+        match = PACKAGE_BYTES_PATTERN.search(raw, 0, PACKAGE_SEARCH_PREFIX)
+        if match:
+            return match.group(1).decode('utf-8')
+        match = PACKAGE_PATTERN.search(content)
         return match.group(1) if match else None
     
     def _extract_imports(self, content: str) -> List[str]:
         """Extract import statements."""
-        imports = re.findall(r'import\s+([\w.*]+);', content)
+        imports = IMPORT_PATTERN.findall(content)
         return imports
     
     def _extract_class_name(self, content: str) -> Optional[str]:
@@ -86,72 +248,75 @@ class JavaFileParser:
         match = self.class_pattern.search(content)
         return match.group(1) if match else None
     
-    def _extract_fields(self, content: str) -> List[Dict[str, Any]]:
-        """Extract field declarations with their annotations."""
+    @staticmethod
+    def _match_lines(pattern: re.Pattern, content: str, line_starts: List[int]):
+        """Yield (line number, match) for the first match of pattern on each line of content."""
+        previous_line = -1
+        for match in pattern.finditer(content):
+            line_number = bisect_right(line_starts, match.start()) - 1
+            if line_number != previous_line:
+                previous_line = line_number
+                yield line_number, match
+    
+    def _extract_fields(self, content: str, line_starts: List[int], stripped: List[str]) -> List[FieldInfo]:
+        """
+        Extract field declarations with their annotations.
+        
+        Declarations are found with one regex pass over the whole file; each field then
+        picks up the annotation run and the JavaDoc run directly above it.
+        """
         fields = []
-        lines = content.split('\n')
         
-        for i, line in enumerate(lines):
-            field_match = self.field_pattern.search(line.strip())
-            if field_match:
-                field_type = field_match.group(1)
-                field_name = field_match.group(2)
-                
-                # Look backwards for annotations
-                annotations = []
-                j = i - 1
-                while j >= 0 and (lines[j].strip().startswith('@') or lines[j].strip() == ''):
-                    if lines[j].strip().startswith('@'):
-                        annotations.insert(0, lines[j].strip())
-                    j -= 1
-                
-                # Look backwards for JavaDoc
-                javadoc = []
-                while j >= 0 and (lines[j].strip().startswith('*') or lines[j].strip().startswith('/**') or lines[j].strip() == ''):
-                    if lines[j].strip():
-                        javadoc.insert(0, lines[j].strip())
-                    j -= 1
-                
-                fields.append({
-                    "name": field_name,
-                    "type": field_type,
-                    "annotations": annotations,
-                    "javadoc": javadoc,
-                    "line_number": i
-                })
+        for i, field_match in self._match_lines(FIELD_LINE_PATTERN, content, line_starts):
+            # Annotations: the run of annotation/blank lines right above the field
+            start = i
+            while start > 0 and (not stripped[start - 1] or stripped[start - 1].startswith('@')):
+                start -= 1
+            annotations = [line for line in stripped[start:i] if line]
+            
+            # JavaDoc: the run of JavaDoc/blank lines above that
+            end = start
+            while start > 0 and (not stripped[start - 1] or stripped[start - 1].startswith(('*', '/**'))):
+                start -= 1
+            javadoc = [line for line in stripped[start:end] if line]
+            
+            fields.append(FieldInfo(
+                name=field_match.group(2),
+                type=field_match.group(1),
+                annotations=annotations,
+                javadoc=javadoc,
+                line_number=i
+            ))
         
         return fields
     
-    def _extract_methods(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_methods(self, content: str, line_starts: List[int], stripped: List[str]) -> List[MethodInfo]:
         """Extract method declarations."""
         methods = []
-        lines = content.split('\n')
         
-        for i, line in enumerate(lines):
-            method_match = self.method_pattern.search(line.strip())
-            if method_match and not line.strip().startswith('//'):
-                return_type = method_match.group(1)
-                method_name = method_match.group(2)
-                
-                methods.append({
-                    "name": method_name,
-                    "return_type": return_type,
-                    "line_number": i,
-                    "full_line": line.strip()
-                })
+        for i, method_match in self._match_lines(METHOD_LINE_PATTERN, content, line_starts):
+            line = stripped[i]
+            if line.startswith('//'):
+                continue
+            
+            methods.append(MethodInfo(
+                name=method_match.group(2),
+                return_type=method_match.group(1),
+                line_number=i,
+                full_line=line
+            ))
         
         return methods
     
-    def _extract_class_annotations(self, content: str) -> List[str]:
+    def _extract_class_annotations(self, lines: List[str], stripped: List[str]) -> List[str]:
         """Extract class-level annotations."""
-        lines = content.split('\n')
         annotations = []
         
-        for line in lines:
-            if line.strip().startswith('@') and 'public class' not in line:
-                annotations.append(line.strip())
-            elif 'public class' in line:
+        for line, stripped_line in zip(lines, stripped):
+            if 'public class' in line:
                 break
+            if stripped_line.startswith('@'):
+                annotations.append(stripped_line)
         
         return annotations
 
@@ -162,17 +327,14 @@ class JavaFileUpdater:
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self.parser = JavaFileParser()
-        self.template_env = None
     
-    def setup_templates(self):
-        """Setup Jinja2 templates for code generation."""
+    @cached_property
+    def template_env(self) -> Optional[Environment]:
+        """Jinja2 environment for code generation, built on first use; None if there is no templates directory."""
         templates_dir = Path("templates")
         if templates_dir.exists():
-            self.template_env = Environment(
-                loader=FileSystemLoader(str(templates_dir)),
-                trim_blocks=True,
-                lstrip_blocks=True
-            )
+            return _template_environment(str(templates_dir.resolve()))
+        return None
     
     def update_model_file(self, file_path: Path, field_operations: List[Any], service_info: Dict) -> bool:
         """
@@ -187,26 +349,25 @@ class JavaFileUpdater:
             True if successful, False otherwise
         """
         try:
-            self.logger.info(f"Updating model file: {file_path}")
+            self.logger.info("Updating model file: %s", file_path)
             
             # Parse existing file
             structure = self.parser.parse_java_file(file_path)
             if "error" in structure:
-                self.logger.error(f"Failed to parse model file: {structure['error']}")
+                self.logger.error("Failed to parse model file: %s", structure['error'])
                 return False
             
             # Apply field operations
             updated_content = self._apply_model_operations(structure, field_operations, service_info)
             
             # Write updated content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            self._write_file(file_path, updated_content)
             
-            self.logger.info(f"✅ Model file updated successfully: {file_path}")
+            self.logger.info("✅ Model file updated successfully: %s", file_path)
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to update model file: {str(e)}")
+            self.logger.error("❌ Failed to update model file: %s", e)
             return False
     
     def update_dto_files(self, request_path: Path, response_path: Path, field_operations: List[Any], service_info: Dict) -> bool:
@@ -223,31 +384,31 @@ class JavaFileUpdater:
             True if successful, False otherwise
         """
         try:
-            self.logger.info(f"Updating DTO files: {request_path}, {response_path}")
-            
-            # Update Request DTO
-            if request_path.exists():
-                request_structure = self.parser.parse_java_file(request_path)
-                if "error" not in request_structure:
-                    updated_request = self._apply_dto_operations(request_structure, field_operations, service_info, "request")
-                    with open(request_path, 'w', encoding='utf-8') as f:
-                        f.write(updated_request)
-            
-            # Update Response DTO
-            if response_path.exists():
-                response_structure = self.parser.parse_java_file(response_path)
-                if "error" not in response_structure:
-                    updated_response = self._apply_dto_operations(response_structure, field_operations, service_info, "response")
-                    with open(response_path, 'w', encoding='utf-8') as f:
-                        f.write(updated_response)
+            self.logger.info("Updating DTO files: %s, %s", request_path, response_path)
+            
+            # Update Request and Response DTOs; they are independent files, so do both at once
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(self._update_dto_file, dto_path, field_operations, service_info, dto_type)
+                    for dto_path, dto_type in ((request_path, "request"), (response_path, "response"))
+                ]
+                for future in futures:
+                    future.result()
             
             self.logger.info("✅ DTO files updated successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to update DTO files: {str(e)}")
+            self.logger.error("❌ Failed to update DTO files: %s", e)
             return False
     
+    def _update_dto_file(self, file_path: Path, field_operations: List[Any], service_info: Dict, dto_type: str) -> None:
+        """Parse, update and write one DTO file, if it exists and parses."""
+        structure = self.parser.parse_java_file(file_path)
+        if "error" not in structure:
+            updated_content = self._apply_dto_operations(structure, field_operations, service_info, dto_type)
+            self._write_file(file_path, updated_content)
+    
     def update_service_file(self, file_path: Path, field_operations: List[Any], service_info: Dict) -> bool:
         """
         Update service file with field operations.
@@ -261,116 +422,108 @@ class JavaFileUpdater:
             True if successful, False otherwise
         """
         try:
-            self.logger.info(f"Updating service file: {file_path}")
+            self.logger.info("Updating service file: %s", file_path)
             
             # Parse existing file
             structure = self.parser.parse_java_file(file_path)
             if "error" in structure:
-                self.logger.error(f"Failed to parse service file: {structure['error']}")
+                self.logger.error("Failed to parse service file: %s", structure['error'])
                 return False
             
             # Apply field operations (mainly update validation and mapping methods)
             updated_content = self._apply_service_operations(structure, field_operations, service_info)
             
             # Write updated content
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            self._write_file(file_path, updated_content)
             
-            self.logger.info(f"✅ Service file updated successfully")
+            self.logger.info("✅ Service file updated successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to update service file: {str(e)}")
+            self.logger.error("❌ Failed to update service file: %s", e)
             return False
     
+    def _write_file(self, file_path: Path, content: str) -> None:
+        """Write content next to the file and swap it into place, so readers never see a partial file."""
+        temp_path = file_path.with_name(file_path.name + '.tmp')
+        try:
+            temp_path.write_bytes(content.encode('utf-8'))
+            shutil.copymode(file_path, temp_path)
+            os.replace(temp_path, file_path)
+            # mtime and size alone can miss a rewrite within the mtime granularity
+            self.parser.invalidate(file_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+    
     def _apply_model_operations(self, structure: Dict, operations: List[Any], service_info: Dict) -> str:
         """Apply field operations to model file content."""
-        lines = structure["lines"][:]
-        existing_fields = {field["name"]: field for field in structure["fields"]}
+        lines = structure["lines"]
+        existing_fields = {field.name: field for field in structure["fields"]}
         
         # Find the class declaration to insert new fields after existing ones
-        class_start = -1
-        last_field_line = -1
+        entity_name = service_info.get("entity", "")
+        class_start = next(
+            (i for i in range(len(lines) - 1, -1, -1) if "public class" in lines[i] and entity_name in lines[i]),
+            -1
+        )
         
-        for i, line in enumerate(lines):
-            if "public class" in line and service_info.get("entity", "") in line:
-                class_start = i
-            
-            # Find the last field declaration
-            for field in structure["fields"]:
-                if field["line_number"] > last_field_line:
-                    last_field_line = field["line_number"]
+        # Find the last field declaration
+        last_field_line = max((field.line_number for field in structure["fields"]), default=-1)
+        
+        # Collect the edits against the original line numbers, then apply them in one pass
+        added_lines = []
+        updated_blocks = {}
+        removed_fields = set()
         
-        # Apply operations in reverse order to maintain line numbers
         for operation in reversed(operations):
             if operation.action == "add":
                 field_data = operation.field_data["field"]
                 field_code = self._generate_model_field_code(field_data)
-                
-                # Insert after last field or after class declaration
-                insert_line = last_field_line + 1 if last_field_line > -1 else class_start + 2
-                
-                # Insert field code
-                field_lines = field_code.split('\n')
-                for j, field_line in enumerate(field_lines):
-                    lines.insert(insert_line + j, field_line)
-                
-                last_field_line += len(field_lines)
+                added_lines.extend(field_code.split('\n'))
             
             elif operation.action == "remove":
                 field_name = operation.field_data["field_name"]
                 if field_name in existing_fields:
-                    field_info = existing_fields[field_name]
-                    
                     # Remove field and its annotations/javadoc
-                    start_line = field_info["line_number"]
-                    end_line = start_line
-                    
-                    # Find start of field block (including annotations)
-                    while start_line > 0 and (lines[start_line-1].strip().startswith('@') or 
-                                            lines[start_line-1].strip().startswith('*') or
-                                            lines[start_line-1].strip().startswith('/**') or
-                                            lines[start_line-1].strip() == ''):
-                        start_line -= 1
-                    
-                    # Remove lines
-                    for _ in range(end_line - start_line + 1):
-                        if start_line < len(lines):
-                            lines.pop(start_line)
+                    removed_fields.add(field_name)
             
             elif operation.action == "update":
                 field_name = operation.field_data["field_name"]
                 changes = operation.field_data["changes"]
                 
                 if field_name in existing_fields:
-                    field_info = existing_fields[field_name]
-                    field_line = field_info["line_number"]
+                    block, field_line = self._editable_field_block(lines, updated_blocks, existing_fields[field_name])
                     
                     # Update field type if specified
                     if "type" in changes:
                         java_type = self._sql_to_java_type(changes["type"])
-                        pattern = rf'private\s+\w+(?:<.*?>)?\s+{field_name};'
                         replacement = f'private {java_type} {field_name};'
-                        lines[field_line] = re.sub(pattern, replacement, lines[field_line])
+                        block[field_line] = _field_declaration_pattern(field_name).sub(replacement, block[field_line])
                     
                     # Update validation annotations
                     if "validation" in changes:
-                        self._update_field_annotations(lines, field_info, changes["validation"])
+                        self._update_field_annotations(block, replace(existing_fields[field_name], line_number=field_line), changes["validation"])
         
-        return '\n'.join(lines)
+        # Insert after last field or after class declaration
+        insert_line = last_field_line + 1 if last_field_line > -1 else class_start + 2
+        edits = self._field_edits(lines, existing_fields, insert_line, added_lines, updated_blocks, removed_fields)
+        
+        return structure["newline"].join(self._merge_line_edits(lines, edits))
     
     def _apply_dto_operations(self, structure: Dict, operations: List[Any], service_info: Dict, dto_type: str) -> str:
         """Apply field operations to DTO file content."""
-        lines = structure["lines"][:]
-        existing_fields = {field["name"]: field for field in structure["fields"]}
+        lines = structure["lines"]
+        existing_fields = {field.name: field for field in structure["fields"]}
         
         # Find insertion point
-        last_field_line = -1
-        for field in structure["fields"]:
-            if field["line_number"] > last_field_line:
-                last_field_line = field["line_number"]
+        last_field_line = max((field.line_number for field in structure["fields"]), default=-1)
+        
+        # Collect the edits against the original line numbers, then apply them in one pass
+        added_lines = []
+        updated_blocks = {}
+        removed_fields = set()
         
-        # Apply operations
         for operation in reversed(operations):
             if operation.action == "add":
                 field_data = operation.field_data["field"]
@@ -380,68 +533,113 @@ class JavaFileUpdater:
                     continue
                 
                 field_code = self._generate_dto_field_code(field_data, dto_type)
-                
-                # Insert field
-                insert_line = last_field_line + 1 if last_field_line > -1 else len(lines) - 5
-                field_lines = field_code.split('\n')
-                for j, field_line in enumerate(field_lines):
-                    lines.insert(insert_line + j, field_line)
-                
-                last_field_line += len(field_lines)
+                added_lines.extend(field_code.split('\n'))
             
             elif operation.action == "remove":
                 field_name = operation.field_data["field_name"]
                 if field_name in existing_fields:
-                    field_info = existing_fields[field_name]
-                    self._remove_field_block(lines, field_info)
+                    removed_fields.add(field_name)
             
             elif operation.action == "update":
                 field_name = operation.field_data["field_name"]
                 changes = operation.field_data["changes"]
                 
                 if field_name in existing_fields:
-                    self._update_dto_field(lines, existing_fields[field_name], changes)
+                    block, field_line = self._editable_field_block(lines, updated_blocks, existing_fields[field_name])
+                    self._update_dto_field(block, replace(existing_fields[field_name], line_number=field_line), changes)
+        
+        # Insert after the last field, or near the end of the class if there are none
+        insert_line = last_field_line + 1 if last_field_line > -1 else max(len(lines) - 5, 0)
+        edits = self._field_edits(lines, existing_fields, insert_line, added_lines, updated_blocks, removed_fields)
+        lines = self._merge_line_edits(lines, edits)
         
         # Update getters/setters and constructors
         self._update_dto_methods(lines, operations, service_info, dto_type)
         
-        return '\n'.join(lines)
+        return structure["newline"].join(lines)
     
     def _apply_service_operations(self, structure: Dict, operations: List[Any], service_info: Dict) -> str:
         """Apply field operations to service file content."""
-        lines = structure["lines"][:]
+        lines = structure["lines"]
+        
+        # Locate every method body once; additions and removals are collected as edits against it
+        method_spans = self._build_method_index(lines)
+        
+        # References to removed fields are deleted from the original lines only, in one pass, so a
+        # field that is removed and then re-added keeps the lines added for it
+        removed_fields = [operation.field_data["field_name"] for operation in operations if operation.action == "remove"]
+        edits = self._remove_field_references(lines, removed_fields) if removed_fields else []
+        
+        # A field added and then removed later in the same request contributes nothing
+        last_removal = {
+            operation.field_data["field_name"]: index
+            for index, operation in enumerate(operations) if operation.action == "remove"
+        }
         
         # Update validation methods and field mappings
-        for operation in operations:
+        for index, operation in enumerate(operations):
             if operation.action == "add":
                 field_data = operation.field_data["field"]
+                if last_removal.get(field_data["name"], -1) > index:
+                    continue
                 
                 # Add validation for new fields
                 if field_data.get("validation", {}).get("required"):
-                    self._add_field_validation(lines, field_data, service_info)
+                    edits.extend(self._add_field_validation(method_spans, field_data, service_info))
                 
                 # Add field mapping in conversion methods
-                self._add_field_mapping(lines, field_data, service_info)
-            
-            elif operation.action == "remove":
-                field_name = operation.field_data["field_name"]
-                self._remove_field_references(lines, field_name)
-            
-            elif operation.action == "update":
+                edits.extend(self._add_field_mapping(method_spans, field_data, service_info))
+        
+        lines = self._merge_line_edits(lines, edits)
+        
+        for operation in operations:
+            if operation.action == "update":
                 field_name = operation.field_data["field_name"]
                 changes = operation.field_data["changes"]
                 self._update_field_validation(lines, field_name, changes)
         
-        return '\n'.join(lines)
+        return structure["newline"].join(lines)
+    
+    @staticmethod
+    def _build_method_index(lines: List[str]) -> Dict[str, Tuple[int, int]]:
+        """Map each method declared in the class body to its declaration and closing-brace lines."""
+        method_spans = {}
+        depth = 0
+        current = None
+        opened = False
+        
+        for i, line in enumerate(lines):
+            if current is None and depth == 1:
+                match = METHOD_DECLARATION_PATTERN.match(line)
+                if match:
+                    current = (match.group(1), i)
+                    opened = False
+            
+            depth += line.count('{') - line.count('}')
+            
+            if current is not None:
+                if depth > 1:
+                    opened = True
+                elif opened or line.rstrip().endswith(';'):
+                    method_spans.setdefault(current[0], (current[1], i))
+                    current = None
+        
+        return method_spans
     
     def _generate_model_field_code(self, field_data: Dict) -> str:
         """Generate Java code for a model field."""
-        code_lines = []
+        name = field_data["name"]
+        java_type = field_data["javaType"]
+        validation = field_data.get("validation", {})
+        max_length = validation.get("maxLength")
+        field_title = name.replace("_", " ").title()
         
         # Add JavaDoc comment
-        code_lines.append("    /**")
-        code_lines.append(f"     * {field_data.get('description', field_data['name'])}")
-        code_lines.append("     */")
+        code_lines = [
+            "    /**",
+            f"     * {field_data.get('description', name)}",
+            "     */",
+        ]
         
         # Add JPA annotations
         if field_data.get("primaryKey"):
@@ -449,114 +647,161 @@ class JavaFileUpdater:
             if field_data.get("autoGenerated"):
                 code_lines.append("    @GeneratedValue(strategy = GenerationType.IDENTITY)")
         
-        if field_data.get("name") == "created_at" and field_data.get("autoGenerated"):
+        if name == "created_at" and field_data.get("autoGenerated"):
             code_lines.append("    @CreationTimestamp")
-        elif field_data.get("name") == "updated_at" and field_data.get("updateOnModify"):
+        elif name == "updated_at" and field_data.get("updateOnModify"):
             code_lines.append("    @UpdateTimestamp")
         
         # Column annotation
-        column_parts = [f'name = "{field_data["name"]}"']
+        column_parts = [f'name = "{name}"']
         if not field_data.get("nullable", True):
             column_parts.append("nullable = false")
-        if field_data.get("validation", {}).get("maxLength"):
-            column_parts.append(f"length = {field_data['validation']['maxLength']}")
+        if max_length:
+            column_parts.append(f"length = {max_length}")
         
         code_lines.append(f"    @Column({', '.join(column_parts)})")
         
         # Validation annotations
-        validation = field_data.get("validation", {})
         if validation.get("required"):
-            code_lines.append("    @NotNull(message = \"" + field_data["name"].replace("_", " ").title() + " is required\")")
+            code_lines.append(f"    @NotNull(message = \"{field_title} is required\")")
         
-        if field_data["javaType"] == "String" and validation.get("maxLength"):
-            code_lines.append(f"    @Size(max = {validation['maxLength']}, message = \"" + 
-                            field_data["name"].replace("_", " ").title() + 
-                            f" cannot exceed {validation['maxLength']} characters\")")
+        if java_type == "String" and max_length:
+            code_lines.append(f"    @Size(max = {max_length}, message = \"{field_title} cannot exceed {max_length} characters\")")
         
-        if field_data["javaType"] in ["BigDecimal", "Integer", "Long"] and validation.get("min") is not None:
-            code_lines.append(f"    @DecimalMin(value = \"{validation['min']}\", message = \"" +
-                            field_data["name"].replace("_", " ").title() + 
-                            f" must be at least {validation['min']}\")")
+        if java_type in ["BigDecimal", "Integer", "Long"] and validation.get("min") is not None:
+            code_lines.append(f"    @DecimalMin(value = \"{validation['min']}\", message = \"{field_title} must be at least {validation['min']}\")")
         
         # Field declaration
-        java_type = field_data["javaType"]
-        camel_case_name = self._to_camel_case(field_data["name"])
-        code_lines.append(f"    private {java_type} {camel_case_name};")
+        code_lines.append(f"    private {java_type} {self._to_camel_case(name)};")
         code_lines.append("")
         
         return '\n'.join(code_lines)
     
     def _generate_dto_field_code(self, field_data: Dict, dto_type: str) -> str:
         """Generate Java code for a DTO field."""
-        code_lines = []
+        name = field_data["name"]
+        java_type = field_data["javaType"]
+        description = field_data.get('description', name)
+        validation = field_data.get("validation", {})
+        max_length = validation.get("maxLength")
+        is_request = dto_type == "request"
         
         # Add JavaDoc comment
-        code_lines.append("    /**")
-        code_lines.append(f"     * {field_data.get('description', field_data['name'])}")
-        code_lines.append("     */")
+        code_lines = [
+            "    /**",
+            f"     * {description}",
+            "     */",
+        ]
         
         # Add Swagger annotation
         example_value = self._get_example_value(field_data)
-        required = "true" if field_data.get("validation", {}).get("required") and dto_type == "request" else "false"
+        required = "true" if validation.get("required") and is_request else "false"
         
-        code_lines.append(f"    @Schema(description = \"{field_data.get('description', field_data['name'])}\",")
+        code_lines.append(f"    @Schema(description = \"{description}\",")
         code_lines.append(f"            required = {required},")
-        if field_data.get("validation", {}).get("maxLength"):
-            code_lines.append(f"            maxLength = {field_data['validation']['maxLength']},")
+        if max_length:
+            code_lines.append(f"            maxLength = {max_length},")
         code_lines.append(f"            example = \"{example_value}\")")
         
         # Add JSON property annotation
-        code_lines.append(f"    @JsonProperty(\"{field_data['name']}\")")
+        code_lines.append(f"    @JsonProperty(\"{name}\")")
         
         # Add validation annotations for request DTOs
-        if dto_type == "request":
-            validation = field_data.get("validation", {})
+        if is_request:
+            field_title = name.replace("_", " ").title()
             if validation.get("required"):
-                code_lines.append("    @NotNull(message = \"" + field_data["name"].replace("_", " ").title() + " is required\")")
-                if field_data["javaType"] == "String":
-                    code_lines.append("    @NotBlank(message = \"" + field_data["name"].replace("_", " ").title() + " cannot be blank\")")
+                code_lines.append(f"    @NotNull(message = \"{field_title} is required\")")
+                if java_type == "String":
+                    code_lines.append(f"    @NotBlank(message = \"{field_title} cannot be blank\")")
             
-            if field_data["javaType"] == "String" and validation.get("maxLength"):
-                code_lines.append(f"    @Size(max = {validation['maxLength']}, message = \"" + 
-                                field_data["name"].replace("_", " ").title() + 
-                                f" cannot exceed {validation['maxLength']} characters\")")
+            if java_type == "String" and max_length:
+                code_lines.append(f"    @Size(max = {max_length}, message = \"{field_title} cannot exceed {max_length} characters\")")
         
         # Field declaration
-        java_type = field_data["javaType"]
-        camel_case_name = self._to_camel_case(field_data["name"])
-        code_lines.append(f"    private {java_type} {camel_case_name};")
+        code_lines.append(f"    private {java_type} {self._to_camel_case(name)};")
         code_lines.append("")
         
         return '\n'.join(code_lines)
     
-    def _remove_field_block(self, lines: List[str], field_info: Dict) -> None:
+    @staticmethod
+    def _field_block_start(lines: List[str], line_number: int) -> int:
+        """Return the first line of a field's block, including its annotations, JavaDoc and leading blank lines."""
+        start_line = line_number
+        while start_line > 0:
+            previous = lines[start_line - 1].strip()
+            if previous and not previous.startswith(('@', '*', '/**')):
+                break
+            start_line -= 1
+        return start_line
+    
+    def _remove_field_block(self, lines: List[str], field_info: FieldInfo) -> None:
         """Remove a field block including annotations and JavaDoc."""
-        start_line = field_info["line_number"]
+        start_line = self._field_block_start(lines, field_info.line_number)
         
-        # Find start of field block
-        while start_line > 0 and (lines[start_line-1].strip().startswith('@') or 
-                                lines[start_line-1].strip().startswith('*') or
-                                lines[start_line-1].strip().startswith('/**') or
-                                lines[start_line-1].strip() == ''):
-            start_line -= 1
+        # Remove the whole block in one splice
+        del lines[start_line:field_info.line_number + 1]
+    
+    def _editable_field_block(self, lines: List[str], blocks: Dict[str, Tuple[int, List[str]]],
+                              field_info: FieldInfo) -> Tuple[List[str], int]:
+        """Return a working copy of a field's block, shared across operations, and the field's line within it."""
+        field_name = field_info.name
+        if field_name not in blocks:
+            start_line = self._field_block_start(lines, field_info.line_number)
+            blocks[field_name] = (start_line, lines[start_line:field_info.line_number + 1])
+        start_line, block = blocks[field_name]
+        return block, field_info.line_number - start_line
+    
+    def _field_edits(self, lines: List[str], existing_fields: Dict[str, FieldInfo], insert_line: int,
+                     added_lines: List[str], updated_blocks: Dict[str, Tuple[int, List[str]]],
+                     removed_fields: set) -> List[Tuple[int, int, List[str]]]:
+        """Turn collected field changes into (start, end, replacement) edits on the original lines."""
+        edits = []
+        if added_lines:
+            edits.append((insert_line, insert_line, added_lines))
+        for field_name in removed_fields:
+            line_number = existing_fields[field_name].line_number
+            edits.append((self._field_block_start(lines, line_number), line_number + 1, []))
+        for field_name, (start_line, block) in updated_blocks.items():
+            # Removing a field supersedes any update to it
+            if field_name not in removed_fields:
+                edits.append((start_line, existing_fields[field_name].line_number + 1, block))
+        return edits
+    
+    @staticmethod
+    def _merge_line_edits(lines: List[str], edits: List[Tuple[int, int, List[str]]]) -> List[str]:
+        """
+        Apply non-overlapping (start, end, replacement) edits to lines in a single forward pass.
         
-        # Remove lines
-        end_line = field_info["line_number"]
-        for _ in range(end_line - start_line + 1):
-            if start_line < len(lines):
-                lines.pop(start_line)
+        Raises:
+            ValueError: If two edits overlap, rather than silently dropping one of them
+        """
+        merged = []
+        cursor = 0
+        for start, end, replacement in sorted(edits, key=itemgetter(0, 1)):
+            if start < cursor:
+                raise ValueError(
+                    f"Conflicting edits: lines {start + 1}-{end} overlap lines already rewritten up to line {cursor}"
+                )
+            merged.extend(lines[cursor:start])
+            merged.extend(replacement)
+            cursor = end
+        merged.extend(lines[cursor:])
+        return merged
     
-    def _update_field_annotations(self, lines: List[str], field_info: Dict, validation: Dict) -> None:
+    def _update_field_annotations(self, lines: List[str], field_info: FieldInfo, validation: Dict) -> None:
         """Update validation annotations for a field."""
-        field_line = field_info["line_number"]
-        
-        # Remove old validation annotations
-        i = field_line - 1
-        while i >= 0 and lines[i].strip().startswith('@'):
-            if any(anno in lines[i] for anno in ['@NotNull', '@Size', '@DecimalMin', '@DecimalMax']):
-                lines.pop(i)
-                field_line -= 1
-            i -= 1
+        field_line = field_info.line_number
+        
+        # Remove old validation annotations from the annotation block above the field
+        block_start = field_line
+        while block_start > 0 and lines[block_start - 1].strip().startswith('@'):
+            block_start -= 1
+        kept = [
+            line for line in lines[block_start:field_line]
+            if not any(anno in line for anno in ['@NotNull', '@Size', '@DecimalMin', '@DecimalMax'])
+        ]
+        lines[block_start:field_line] = kept
+        field_line = block_start + len(kept)
         
         # Add new validation annotations
         new_annotations = []
@@ -565,8 +810,7 @@ class JavaFileUpdater:
         if validation.get("maxLength"):
             new_annotations.append(f"    @Size(max = {validation['maxLength']}, message = \"Field too long\")")
         
-        for j, annotation in enumerate(new_annotations):
-            lines.insert(field_line + j, annotation)
+        lines[field_line:field_line] = new_annotations
     
     def _update_dto_methods(self, lines: List[str], operations: List[Any], service_info: Dict, dto_type: str) -> None:
         """Update getter/setter methods and constructors in DTO."""
@@ -606,92 +850,74 @@ class JavaFileUpdater:
 """
                 # Insert before class closing brace
                 getter_setter_lines = getter_setter.strip().split('\n')
-                for j, line in enumerate(getter_setter_lines):
-                    lines.insert(class_end + j, line)
+                lines[class_end:class_end] = getter_setter_lines
                 
                 class_end += len(getter_setter_lines)
     
-    def _add_field_validation(self, lines: List[str], field_data: Dict, service_info: Dict) -> None:
+    def _add_field_validation(self, method_spans: Dict[str, Tuple[int, int]], field_data: Dict,
+                              service_info: Dict) -> List[Tuple[int, int, List[str]]]:
         """Add validation logic for new fields in service methods."""
-        # Find validation method
-        for i, line in enumerate(lines):
-            if "validateCreateRequest" in line or "validateUpdateRequest" in line:
-                # Find end of method
-                j = i
-                brace_count = 0
-                while j < len(lines):
-                    if '{' in lines[j]:
-                        brace_count += lines[j].count('{')
-                    if '}' in lines[j]:
-                        brace_count -= lines[j].count('}')
-                        if brace_count == 0:
-                            break
-                    j += 1
-                
-                # Insert validation before method end
-                if field_data.get("validation", {}).get("required"):
-                    camel_case_name = self._to_camel_case(field_data["name"])
-                    field_title = field_data["name"].replace("_", " ").title()
-                    
-                    if field_data["javaType"] == "String":
-                        validation_code = f"""        if (!StringUtils.hasText(request.get{self._to_pascal_case(field_data["name"])}())) {{
+        # Use whichever validation method is declared first
+        spans = [method_spans[name] for name in ("validateCreateRequest", "validateUpdateRequest") if name in method_spans]
+        if not spans or not field_data.get("validation", {}).get("required"):
+            return []
+        
+        camel_case_name = self._to_camel_case(field_data["name"])
+        field_title = field_data["name"].replace("_", " ").title()
+        
+        if field_data["javaType"] == "String":
+            validation_code = f"""        if (!StringUtils.hasText(request.get{self._to_pascal_case(field_data["name"])}())) {{
             throw new BusinessException("{field_title} is required");
         }}"""
-                    else:
-                        validation_code = f"""        if (request.get{self._to_pascal_case(field_data["name"])}() == null) {{
+        else:
+            validation_code = f"""        if (request.get{self._to_pascal_case(field_data["name"])}() == null) {{
             throw new BusinessException("{field_title} is required");
         }}"""
-                    
-                    lines.insert(j - 1, validation_code)
-                break
+        
+        # Insert validation before method end
+        method_end = min(spans)[1]
+        return [(method_end, method_end, [validation_code])]
     
-    def _add_field_mapping(self, lines: List[str], field_data: Dict, service_info: Dict) -> None:
+    def _add_field_mapping(self, method_spans: Dict[str, Tuple[int, int]], field_data: Dict,
+                           service_info: Dict) -> List[Tuple[int, int, List[str]]]:
         """Add field mapping in entity conversion methods."""
-        camel_case_name = self._to_camel_case(field_data["name"])
         pascal_case_name = self._to_pascal_case(field_data["name"])
+        entity_var = service_info.get('entity', 'Entity').lower()
+        
+        mappings = []
+        if not field_data.get("autoGenerated", False):
+            mappings.append(("createEntityFromRequest",
+                             f"        {entity_var}.set{pascal_case_name}(request.get{pascal_case_name}());"))
+        mappings.append(("convertToResponse",
+                         f"        response.set{pascal_case_name}({entity_var}.get{pascal_case_name}());"))
+        
+        # Add field mapping before the method's final (return) statement
+        edits = []
+        for method_name, mapping in mappings:
+            span = method_spans.get(method_name)
+            if span and span[1] > span[0]:
+                edits.append((span[1] - 1, span[1] - 1, [mapping]))
+        return edits
+    
+    def _remove_field_references(self, lines: List[str], field_names: List[str]) -> List[Tuple[int, int, List[str]]]:
+        """Remove references to the given fields from service methods."""
+        names = "|".join(re.escape(self._to_pascal_case(field_name)) for field_name in field_names)
         
-        # Find conversion methods and add field mapping
-        for i, line in enumerate(lines):
-            if "createEntityFromRequest" in line or "updateEntityFromRequest" in line or "convertToResponse" in line:
-                # Find end of method
-                j = i
-                brace_count = 0
-                while j < len(lines):
-                    if '{' in lines[j]:
-                        brace_count += lines[j].count('{')
-                    if '}' in lines[j]:
-                        brace_count -= lines[j].count('}')
-                        if brace_count == 0:
-                            break
-                    j += 1
-                
-                # Add field mapping before method end
-                if "createEntityFromRequest" in line and not field_data.get("autoGenerated", False):
-                    mapping = f"        {service_info.get('entity', 'Entity').lower()}.set{pascal_case_name}(request.get{pascal_case_name}());"
-                    lines.insert(j - 1, mapping)
-                elif "convertToResponse" in line:
-                    mapping = f"        response.set{pascal_case_name}({service_info.get('entity', 'Entity').lower()}.get{pascal_case_name}());"
-                    lines.insert(j - 1, mapping)
-    
-    def _remove_field_references(self, lines: List[str], field_name: str) -> None:
-        """Remove references to a field from service methods."""
-        pascal_case_name = self._to_pascal_case(field_name)
-        
-        # Remove lines that reference the field
-        i = 0
-        while i < len(lines):
-            if f"get{pascal_case_name}()" in lines[i] or f"set{pascal_case_name}(" in lines[i]:
-                lines.pop(i)
-            else:
-                i += 1
+        # Delete every line that calls a getter or setter of any of the fields
+        references = re.compile(rf"get(?:{names})\(\)|set(?:{names})\(")
+        return [(i, i + 1, []) for i, line in enumerate(lines) if references.search(line)]
     
     def _update_field_validation(self, lines: List[str], field_name: str, changes: Dict) -> None:
         """Update validation for an existing field."""
         pascal_case_name = self._to_pascal_case(field_name)
         
+        if "validation" not in changes:
+            return
+        
         # Find validation references and update them
+        getter = f"get{pascal_case_name}()"
         for i, line in enumerate(lines):
-            if f"get{pascal_case_name}()" in line and "validation" in changes:
+            if getter in line:
                 # Update validation logic based on changes
                 if "maxLength" in changes.get("validation", {}):
                     # Update length validation if present
@@ -717,31 +943,6 @@ class JavaFileUpdater:
         else:
             return "sample"
     
-    def _sql_to_java_type(self, sql_type: str) -> str:
-        """Convert SQL type to Java type."""
-        type_mapping = {
-            'BIGSERIAL': 'Long',
-            'BIGINT': 'Long',
-            'INTEGER': 'Integer',
-            'DECIMAL': 'BigDecimal',
-            'VARCHAR': 'String',
-            'TEXT': 'String',
-            'TIMESTAMP': 'LocalDateTime',
-            'DATE': 'LocalDate',
-            'BOOLEAN': 'Boolean'
-        }
-        
-        base_type = sql_type.split('(')[0].upper()
-        return type_mapping.get(base_type, 'String')
-    
-    @staticmethod
-    def _to_camel_case(snake_str: str) -> str:
-        """Convert snake_case to camelCase."""
-        components = snake_str.split('_')
-        return components[0] + ''.join(word.capitalize() for word in components[1:])
-    
-    @staticmethod
-    def _to_pascal_case(snake_str: str) -> str:
-        """Convert snake_case to PascalCase."""
-        components = snake_str.split('_')
-        return ''.join(word.capitalize() for word in components) 
\ No newline at end of file
+    _sql_to_java_type = staticmethod(_sql_to_java_type)
+    _to_camel_case = staticmethod(_to_camel_case)
+    _to_pascal_case = staticmethod(_to_pascal_case)
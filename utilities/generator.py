@@ -15,24 +15,98 @@ import json
 import logging
 import shutil
 import re
-from datetime import datetime
+import time
+import importlib
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
-import traceback
 
-# Third-party imports
+# Third-party imports; colorlog, tqdm and jsonschema are imported where they are used
+# (through _require_dependency), so that starting the CLI doesn't pay for them
 try:
     import click
     from jinja2 import Environment, FileSystemLoader, Template
-    from jsonschema import validate, ValidationError
-    import colorlog
-    from tqdm import tqdm
 except ImportError as e:
     print(f"ERROR: Missing required dependency: {e}")
     print("Please install requirements: pip install -r requirements.txt")
     sys.exit(1)
 
 
+def _require_dependency(name: str) -> Any:
+    """Import a required dependency on first use, failing the same way as the imports above."""
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        print(f"ERROR: Missing required dependency: {e}")
+        print("Please install requirements: pip install -r requirements.txt")
+        sys.exit(1)
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing
+    orjson = None
+
+# Naming patterns used during validation and by the template filters
+SERVICE_NAME_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9]*$')
+SNAKE_CASE_NAME_PATTERN = re.compile(r'^[a-z][a-z0-9_]*$')
+CAMEL_BOUNDARY_PATTERN = re.compile('([a-z0-9])([A-Z])')
+
+# Translation table that deletes the characters the sanitize filter strips
+UNSAFE_CHARS_TABLE = str.maketrans('', '', '<>&"\'')
+
+# Structure every service definition must have; naming conventions are checked separately
+SERVICE_DEFINITION_SCHEMA = {
+    "type": "object",
+    "required": ["service", "database", "fields", "operations", "api"],
+    "properties": {
+        "service": {
+            "type": "object",
+            "required": ["name"],
+            "properties": {"name": {"type": "string"}}
+        },
+        "database": {
+            "type": "object",
+            "required": ["table"],
+            "properties": {"table": {"type": "string"}}
+        },
+        "fields": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["type", "javaType"]
+            }
+        },
+        "api": {
+            "type": "object",
+            "properties": {
+                "endpoints": {
+                    "type": "array",
+                    "items": {"type": "object", "required": ["method", "path"]}
+                }
+            }
+        }
+    }
+}
+
+
+@lru_cache(maxsize=None)
+def _service_definition_validator() -> Any:
+    """Schema validator for service definitions, checked and built once per process."""
+    Draft202012Validator = _require_dependency("jsonschema").Draft202012Validator
+    
+    Draft202012Validator.check_schema(SERVICE_DEFINITION_SCHEMA)
+    return Draft202012Validator(SERVICE_DEFINITION_SCHEMA)
+
+
+def _load_json(path) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 class ViraCodeGenerator:
     """
     Main code generator class that handles the complete generation process.
@@ -60,6 +134,8 @@ class ViraCodeGenerator:
         self.backup_directory = None
         self.jinja_env = None
         self.migration_version = None
+        # One timestamp per run, shared by the log file and backup directory names
+        self._run_timestamp = time.strftime('%Y%m%d_%H%M%S')
         
         # Initialize the generator
         self._setup_logging()
@@ -89,6 +165,7 @@ class ViraCodeGenerator:
         )
         
         # Console handler with colors
+        colorlog = _require_dependency("colorlog")
         console_handler = colorlog.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_formatter = colorlog.ColoredFormatter(
@@ -106,7 +183,7 @@ class ViraCodeGenerator:
         
         # File handler for detailed logs
         file_handler = logging.FileHandler(
-            log_dir / f"generator_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
+            log_dir / f"generator_{self._run_timestamp}.log",
             encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)
@@ -114,7 +191,7 @@ class ViraCodeGenerator:
         self.logger.addHandler(file_handler)
         
         self.logger.info("🚀 Vira Code Generator started")
-        self.logger.info(f"📝 Logging to: {file_handler.baseFilename}")
+        self.logger.info("📝 Logging to: %s", file_handler.baseFilename)
     
     def _load_configuration(self) -> None:
         """
@@ -126,13 +203,12 @@ class ViraCodeGenerator:
             ValueError: If required configuration keys are missing
         """
         try:
-            self.logger.info(f"📖 Loading configuration from: {self.config_path}")
+            self.logger.info("📖 Loading configuration from: %s", self.config_path)
             
             if not Path(self.config_path).exists():
                 raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
             
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                self.config = json.load(file)
+            self.config = _load_json(self.config_path)
             
             # Validate required configuration sections
             required_sections = ['paths', 'generation', 'logging']
@@ -146,10 +222,11 @@ class ViraCodeGenerator:
                 raise ValueError(f"Vira services root directory doesn't exist: {vira_root}")
             
             self.logger.info("✅ Configuration loaded successfully")
-            self.logger.debug(f"Configuration: {json.dumps(self.config, indent=2)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Configuration: %s", json.dumps(self.config, indent=2))
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to load configuration: {str(e)}")
+            self.logger.error("❌ Failed to load configuration: %s", e)
             raise
     
     def _setup_jinja_environment(self) -> None:
@@ -163,12 +240,15 @@ class ViraCodeGenerator:
             templates_dir = Path("templates")
             templates_dir.mkdir(exist_ok=True)
             
-            # Set up Jinja2 environment
+            # Set up Jinja2 environment; templates don't change during a run, so keep every
+            # template once it has been compiled
             self.jinja_env = Environment(
                 loader=FileSystemLoader(str(templates_dir)),
                 trim_blocks=True,
                 lstrip_blocks=True,
-                keep_trailing_newline=True
+                keep_trailing_newline=True,
+                auto_reload=False,
+                cache_size=-1
             )
             
             # Add custom filters for code generation
@@ -181,7 +261,7 @@ class ViraCodeGenerator:
             self.logger.info("✅ Jinja2 environment configured successfully")
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to setup Jinja2 environment: {str(e)}")
+            self.logger.error("❌ Failed to setup Jinja2 environment: %s", e)
             raise
     
     def _create_directories(self) -> None:
@@ -192,8 +272,7 @@ class ViraCodeGenerator:
             self.logger.info("📁 Creating necessary directories")
             
             # Create backup directory with timestamp
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            self.backup_directory = Path(f"backups/backup_{timestamp}")
+            self.backup_directory = Path(f"backups/backup_{self._run_timestamp}")
             self.backup_directory.mkdir(parents=True, exist_ok=True)
             
             # Create output directories
@@ -207,10 +286,10 @@ class ViraCodeGenerator:
             for dir_name in output_dirs:
                 Path(dir_name).mkdir(exist_ok=True)
             
-            self.logger.info(f"✅ Directories created. Backup location: {self.backup_directory}")
+            self.logger.info("✅ Directories created. Backup location: %s", self.backup_directory)
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to create directories: {str(e)}")
+            self.logger.error("❌ Failed to create directories: %s", e)
             raise
     
     def load_service_definition(self, definition_path: str) -> None:
@@ -225,26 +304,35 @@ class ViraCodeGenerator:
             ValidationError: If definition doesn't match schema
         """
         try:
-            self.logger.info(f"📖 Loading service definition from: {definition_path}")
+            self.logger.info("📖 Loading service definition from: %s", definition_path)
             
             if not Path(definition_path).exists():
                 raise FileNotFoundError(f"Service definition file not found: {definition_path}")
             
-            with open(definition_path, 'r', encoding='utf-8') as file:
-                self.service_definition = json.load(file)
+            self.service_definition = _load_json(definition_path)
             
             # Validate the service definition
             self._validate_service_definition()
             
+            # Templates read the derived names directly instead of going through the filters
+            self._precompute_field_names()
+            
             self.logger.info("✅ Service definition loaded and validated successfully")
-            self.logger.info(f"🏷️  Service: {self.service_definition['service']['name']}")
-            self.logger.info(f"📊 Table: {self.service_definition['database']['table']}")
-            self.logger.info(f"🔢 Fields: {len(self.service_definition['fields'])}")
+            self.logger.info("🏷️  Service: %s", self.service_definition['service']['name'])
+            self.logger.info("📊 Table: %s", self.service_definition['database']['table'])
+            self.logger.info("🔢 Fields: %s", len(self.service_definition['fields']))
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to load service definition: {str(e)}")
+            self.logger.error("❌ Failed to load service definition: %s", e)
             raise
     
+    def _precompute_field_names(self) -> None:
+        """Store each field's camelCase and PascalCase names and Java type on the field itself."""
+        for field in self.service_definition['fields']:
+            field['_camel'] = self._to_camel_case(field['name'])
+            field['_pascal'] = self._to_pascal_case(field['name'])
+            field['_java_type'] = self._get_java_type(field['type'])
+    
     def _validate_service_definition(self) -> None:
         """
         Validate the service definition against our schema.
@@ -253,55 +341,40 @@ class ViraCodeGenerator:
         try:
             self.logger.info("🔍 Validating service definition")
             
-            # Basic structure validation
-            required_sections = ['service', 'database', 'fields', 'operations', 'api']
-            for section in required_sections:
-                if section not in self.service_definition:
-                    raise ValueError(f"Required section missing: {section}")
+            # Structure validation: sections, field types and endpoints
+            _service_definition_validator().validate(self.service_definition)
             
             # Validate service name (alphanumeric, no spaces)
             service_name = self.service_definition['service']['name']
-            if not re.match(r'^[a-zA-Z][a-zA-Z0-9]*$', service_name):
+            if not SERVICE_NAME_PATTERN.match(service_name):
                 raise ValueError(f"Invalid service name: {service_name}. Must be alphanumeric, start with letter.")
             
             # Validate table name follows convention
             table_name = self.service_definition['database']['table']
-            if not re.match(r'^[a-z][a-z0-9_]*$', table_name):
+            if not SNAKE_CASE_NAME_PATTERN.match(table_name):
                 raise ValueError(f"Invalid table name: {table_name}. Must be lowercase with underscores.")
             
-            # Validate fields
-            fields = self.service_definition['fields']
-            if not fields or len(fields) == 0:
-                raise ValueError("At least one field is required")
-            
-            # Check for primary key
-            has_primary_key = any(field.get('primaryKey', False) for field in fields)
-            if not has_primary_key:
-                raise ValueError("At least one field must be marked as primaryKey")
-            
-            # Validate field names and types
-            for field in fields:
+            # Validate field names and look for the primary key in a single pass
+            has_primary_key = False
+            for field in self.service_definition['fields']:
                 field_name = field.get('name', '')
-                if not re.match(r'^[a-z][a-z0-9_]*$', field_name):
+                if not SNAKE_CASE_NAME_PATTERN.match(field_name):
                     raise ValueError(f"Invalid field name: {field_name}. Must be lowercase with underscores.")
                 
-                if 'type' not in field or 'javaType' not in field:
-                    raise ValueError(f"Field {field_name} must have both 'type' and 'javaType'")
+                if field.get('primaryKey', False):
+                    has_primary_key = True
                 
                 # Security validation - check for potentially dangerous content
                 if 'validation' in field and 'sanitize' in field['validation']:
-                    self.logger.info(f"🔒 Field {field_name} will be sanitized for security")
+                    self.logger.info("🔒 Field %s will be sanitized for security", field_name)
             
-            # Validate API endpoints
-            if 'endpoints' in self.service_definition['api']:
-                for endpoint in self.service_definition['api']['endpoints']:
-                    if 'method' not in endpoint or 'path' not in endpoint:
-                        raise ValueError("Each endpoint must have 'method' and 'path'")
+            if not has_primary_key:
+                raise ValueError("At least one field must be marked as primaryKey")
             
             self.logger.info("✅ Service definition validation passed")
             
         except Exception as e:
-            self.logger.error(f"❌ Service definition validation failed: {str(e)}")
+            self.logger.error("❌ Service definition validation failed: %s", e)
             raise
     
     def generate_code(self) -> bool:
@@ -331,6 +404,7 @@ class ViraCodeGenerator:
             ]
             
             # Execute generation steps with progress bar
+            tqdm = _require_dependency("tqdm").tqdm
             with tqdm(total=len(generation_steps), desc="Generating code") as pbar:
                 for step_desc, step_func in generation_steps:
                     self.logger.info(step_desc)
@@ -338,7 +412,7 @@ class ViraCodeGenerator:
                     pbar.update(1)
             
             self.logger.info("✅ Code generation completed successfully")
-            self.logger.info(f"📁 Generated {len(self.generated_files)} files")
+            self.logger.info("📁 Generated %s files", len(self.generated_files))
             
             # Print summary
             self._print_generation_summary()
@@ -346,8 +420,8 @@ class ViraCodeGenerator:
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Code generation failed: {str(e)}")
-            self.logger.error(f"🔄 Rolling back changes...")
+            self.logger.error("❌ Code generation failed: %s", e)
+            self.logger.error("🔄 Rolling back changes...")
             self._rollback_changes()
             return False
     
@@ -360,34 +434,34 @@ class ViraCodeGenerator:
             
             if not migration_path.exists():
                 self.migration_version = "V1"
-                self.logger.info(f"📊 Migration directory doesn't exist. Using version: {self.migration_version}")
+                self.logger.info("📊 Migration directory doesn't exist. Using version: %s", self.migration_version)
                 return
             
-            # Find existing migration files
-            migration_files = list(migration_path.glob("V*.sql"))
-            
-            if not migration_files:
+            # Find the highest existing version in one pass over the directory entries
+            has_migrations = False
+            highest_version = 0
+            with os.scandir(migration_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith('V') and name.endswith('.sql')):
+                        continue
+                    has_migrations = True
+                    # Version files are named V<digits>__<description>.sql
+                    separator = name.find('__')
+                    if separator > 1 and name[1:separator].isdecimal():
+                        highest_version = max(highest_version, int(name[1:separator]))
+            
+            if not has_migrations:
                 self.migration_version = "V1"
-                self.logger.info(f"📊 No existing migrations found. Using version: {self.migration_version}")
+                self.logger.info("📊 No existing migrations found. Using version: %s", self.migration_version)
                 return
             
-            # Extract version numbers and find the highest
-            version_numbers = []
-            for file in migration_files:
-                match = re.match(r'V(\d+)__.*\.sql', file.name)
-                if match:
-                    version_numbers.append(int(match.group(1)))
-            
-            if version_numbers:
-                next_version = max(version_numbers) + 1
-                self.migration_version = f"V{next_version}"
-            else:
-                self.migration_version = "V1"
+            self.migration_version = f"V{highest_version + 1}"
             
-            self.logger.info(f"📊 Determined next migration version: {self.migration_version}")
+            self.logger.info("📊 Determined next migration version: %s", self.migration_version)
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to determine migration version: {str(e)}")
+            self.logger.error("❌ Failed to determine migration version: %s", e)
             self.migration_version = "V1"  # Fallback
     
     def _generate_migration(self) -> None:
@@ -443,14 +517,16 @@ class ViraCodeGenerator:
             self.logger.info("🔄 Starting rollback process")
             
             for file_path in reversed(self.generated_files):
-                if Path(file_path).exists():
+                try:
                     Path(file_path).unlink()
-                    self.logger.info(f"🗑️  Removed: {file_path}")
+                except FileNotFoundError:
+                    continue
+                self.logger.info("🗑️  Removed: %s", file_path)
             
             self.logger.info("✅ Rollback completed successfully")
             
         except Exception as e:
-            self.logger.error(f"❌ Rollback failed: {str(e)}")
+            self.logger.error("❌ Rollback failed: %s", e)
     
     def _print_generation_summary(self) -> None:
         """Print a summary of generated files."""
@@ -459,29 +535,32 @@ class ViraCodeGenerator:
         self.logger.info("="*50)
         
         for file_path in self.generated_files:
-            self.logger.info(f"✅ {file_path}")
+            self.logger.info("✅ %s", file_path)
         
         self.logger.info("="*50)
-        self.logger.info(f"🎉 Successfully generated {len(self.generated_files)} files")
+        self.logger.info("🎉 Successfully generated %s files", len(self.generated_files))
         self.logger.info("🚀 Ready for deployment!")
     
-    # Utility methods for template filters
+    # Utility methods for template filters; the case conversions see the same few names repeatedly
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _to_camel_case(snake_str: str) -> str:
         """Convert snake_case to camelCase."""
         components = snake_str.split('_')
-        return components[0] + ''.join(word.capitalize() for word in components[1:])
+        return components[0] + ''.join(map(str.capitalize, components[1:]))
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _to_pascal_case(snake_str: str) -> str:
         """Convert snake_case to PascalCase."""
         components = snake_str.split('_')
-        return ''.join(word.capitalize() for word in components)
+        return ''.join(map(str.capitalize, components))
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _to_snake_case(camel_str: str) -> str:
         """Convert camelCase/PascalCase to snake_case."""
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', camel_str).lower()
+        return CAMEL_BOUNDARY_PATTERN.sub(r'\1_\2', camel_str).lower()
     
     @staticmethod
     def _sanitize_string(value: str) -> str:
@@ -489,26 +568,18 @@ class ViraCodeGenerator:
         if not isinstance(value, str):
             return str(value)
         # Remove potentially dangerous characters
-        return re.sub(r'[<>&"\']', '', value)
+        return value.translate(UNSAFE_CHARS_TABLE)
     
     @staticmethod
     def _get_java_type(sql_type: str) -> str:
         """Map SQL types to Java types."""
-        type_mapping = {
-            'BIGSERIAL': 'Long',
-            'BIGINT': 'Long',
-            'INTEGER': 'Integer',
-            'DECIMAL': 'BigDecimal',
-            'VARCHAR': 'String',
-            'TEXT': 'String',
-            'TIMESTAMP': 'LocalDateTime',
-            'DATE': 'LocalDate',
-            'BOOLEAN': 'Boolean'
-        }
+        # The mapping is shared with the field updater; imported here so that importing
+        # the generator doesn't pull in the whole updater module
+        from file_updater import SQL_TO_JAVA_TYPES
         
         # Extract base type (remove precision/scale)
-        base_type = sql_type.split('(')[0].upper()
-        return type_mapping.get(base_type, 'String')
+        base_type = sql_type.partition('(')[0].upper()
+        return SQL_TO_JAVA_TYPES.get(base_type, 'String')
 
 
 def detect_operation_type(definition_file: str) -> str:
@@ -559,25 +630,16 @@ def main(config: str, definition: str, operation: str, dry_run: bool, verbose: b
             if verbose:
                 modifier.logger.setLevel(logging.DEBUG)
             
-            # Override dry-run if specified
+            # Override dry-run if specified, handing the parsed data over directly
             if dry_run:
                 with open(definition, 'r') as f:
                     ops_data = json.load(f)
                 ops_data.setdefault('options', {})['dry_run'] = True
-                
-                temp_file = definition + ".tmp"
-                with open(temp_file, 'w') as f:
-                    json.dump(ops_data, f, indent=2)
-                
-                definition = temp_file
+                definition = ops_data
             
             # Process field operations
             success = modifier.process_field_operations(definition)
             
-            # Clean up temp file
-            if dry_run and definition.endswith('.tmp'):
-                Path(definition).unlink()
-            
             if success:
                 print("\n🎉 Field modification completed successfully!")
                 print("🚀 Your service modifications are ready!")
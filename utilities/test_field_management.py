@@ -18,71 +18,212 @@ import sys
 import os
 import tempfile
 import shutil
+import logging
+import time
+from functools import lru_cache
+from dataclasses import dataclass, fields
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
 
-def test_json_validation():
-    """Test JSON validation for field operations."""
-    print("🧪 Testing JSON validation...")
-    
-    # Test valid JSON
-    valid_json = {
-        "operation_type": "modify_service",
-        "target_service": {
-            "name": "test",
-            "table": "test_table",
-            "entity": "TestEntity"
-        },
-        "field_operations": [
-            {
-                "action": "add",
-                "field": {
-                    "name": "test_field",
-                    "type": "VARCHAR(100)",
-                    "javaType": "String",
-                    "nullable": True,
-                    "description": "Test field"
-                }
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON serialization
+    orjson = None
+
+# Every fixture path is built from this directory rather than the working directory
+BASE = Path(__file__).resolve().parent
+
+# Make the utilities importable wherever the script is run from; running it directly already adds this directory
+_UTILITIES_DIR = str(BASE)
+if _UTILITIES_DIR not in sys.path:
+    sys.path.insert(0, _UTILITIES_DIR)
+
+try:
+    from field_modifier import FieldModifier, ImpactAnalyzer, FieldOperation
+    from file_updater import JavaFileParser, JavaFileUpdater
+    IMPORT_ERROR = None
+except ImportError as e:
+    # Reported by the tests that need these modules
+    IMPORT_ERROR = e
+
+# Templates exercised by the template rendering test
+TEMPLATES_DIR = BASE / "templates" / "field_operations"
+# Fixtures that runs before the move to a temporary directory left next to the script
+LEGACY_FIXTURE_PATHS = tuple(BASE / name for name in (
+    "test_field_operations.json",
+    "test_invalid_operations.json",
+    "test_config.json",
+    "TestEntity.java",
+    "mock_vira_project"
+))
+
+# Valid field operations fixture
+VALID_OPERATIONS = {
+    "operation_type": "modify_service",
+    "target_service": {
+        "name": "test",
+        "table": "test_table",
+        "entity": "TestEntity"
+    },
+    "field_operations": [
+        {
+            "action": "add",
+            "field": {
+                "name": "test_field",
+                "type": "VARCHAR(100)",
+                "javaType": "String",
+                "nullable": True,
+                "description": "Test field"
             }
-        ],
-        "options": {
-            "dry_run": True,
-            "backup_enabled": True
         }
+    ],
+    "options": {
+        "dry_run": True,
+        "backup_enabled": True
+    }
+}
+
+# Content shared by the mock Java files in the backup test
+MOCK_JAVA_SOURCE = "// Mock Java file\npublic class MockClass {\n    // Mock content\n}"
+
+# Source of the entity parsed in the file parser test
+TEST_ENTITY_SOURCE = """package com.vira.test.model;
+
+import jakarta.persistence.*;
+import jakarta.validation.constraints.*;
+
+/**
+ * Test entity for parsing
+ */
+@Entity
+@Table(name = "test_table")
+public class TestEntity {
+
+    /**
+     * Primary key
+     */
+    @Id
+    @GeneratedValue(strategy = GenerationType.IDENTITY)
+    private Long id;
+
+    /**
+     * Test name field
+     */
+    @Column(name = "name", nullable = false, length = 100)
+    @NotNull(message = "Name is required")
+    @Size(max = 100)
+    private String name;
+
+    /**
+     * Test description field
+     */
+    @Column(name = "description")
+    private String description;
+
+    // Constructors
+    public TestEntity() {}
+
+    // Getters and setters
+    public Long getId() { return id; }
+    public void setId(Long id) { this.id = id; }
+
+    public String getName() { return name; }
+    public void setName(String name) { this.name = name; }
+}"""
+
+# Service whose title field is removed and re-added by the service update test
+TEST_SERVICE_SOURCE = """package com.vira.test.service;
+
+public class TestEntityService {
+
+    private TestEntity createEntityFromRequest(TestEntityRequest request) {
+        TestEntity testentity = new TestEntity();
+        testentity.setName(request.getName());
+        testentity.setTitle(request.getTitle());
+        return testentity;
     }
+
+    private TestEntityResponse convertToResponse(TestEntity testentity) {
+        TestEntityResponse response = new TestEntityResponse();
+        response.setName(testentity.getName());
+        response.setTitle(testentity.getTitle());
+        return response;
+    }
+}
+"""
+
+# Invalid field operations fixture
+INVALID_OPERATIONS = {
+    "operation_type": "invalid_type",  # Invalid
+    "field_operations": []  # Missing target_service
+}
+
+def _dumps(payload) -> bytes:
+    """Serialize a fixture as indented JSON with sorted keys, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, indent=2, sort_keys=True).encode('utf-8')
+
+def _loads(data: bytes):
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# The fixtures never change, so they are serialized once at import
+VALID_OPERATIONS_JSON = _dumps(VALID_OPERATIONS)
+INVALID_OPERATIONS_JSON = _dumps(INVALID_OPERATIONS)
+
+def _require_utilities() -> None:
+    """Raise the import error recorded at startup, if the utilities could not be imported."""
+    if IMPORT_ERROR is not None:
+        raise IMPORT_ERROR
+
+@lru_cache(maxsize=1)
+def _get_impact_analyzer() -> "ImpactAnalyzer":
+    """Return the shared ImpactAnalyzer; it keeps no per-analysis state."""
+    logger = logging.getLogger("TestLogger")
+    logger.setLevel(logging.INFO)
+    handler = logging.StreamHandler()
+    logger.addHandler(handler)
+    return ImpactAnalyzer(logger)
+
+@lru_cache(maxsize=1)
+def _get_jinja_env():
+    """Return the Jinja2 environment for the field operation templates, built once per process."""
+    from jinja2 import Environment, FileSystemLoader
+    
+    # Nothing is written to disk; compiled templates are only kept for this process
+    return Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)), auto_reload=False)
+
+def test_json_validation(base: Path = BASE):
+    """Test JSON validation for field operations."""
+    print("🧪 Testing JSON validation...")
     
     # Write test JSON
-    test_file = Path("test_field_operations.json")
-    with open(test_file, 'w') as f:
-        json.dump(valid_json, f, indent=2)
+    test_file = base / "test_field_operations.json"
+    test_file.write_bytes(VALID_OPERATIONS_JSON)
     
     print("✅ Valid JSON created for testing")
     
     # Test invalid JSON
-    invalid_json = {
-        "operation_type": "invalid_type",  # Invalid
-        "field_operations": []  # Missing target_service
-    }
-    
-    invalid_file = Path("test_invalid_operations.json")
-    with open(invalid_file, 'w') as f:
-        json.dump(invalid_json, f, indent=2)
+    invalid_file = base / "test_invalid_operations.json"
+    invalid_file.write_bytes(INVALID_OPERATIONS_JSON)
     
     print("✅ Invalid JSON created for validation testing")
     
     return test_file, invalid_file
 
-def test_backup_functionality():
+def test_backup_functionality(base: Path = BASE):
     """Test backup and restore functionality."""
     print("🧪 Testing backup functionality...")
     
     # Create mock project structure
-    mock_project = Path("mock_vira_project")
+    mock_project = base / "mock_vira_project"
     mock_project.mkdir(exist_ok=True)
     
     # Create mock files
     mock_service_dir = mock_project / "src" / "main" / "java" / "com" / "vira" / "test"
-    mock_service_dir.mkdir(parents=True, exist_ok=True)
     
     # Create mock Java files
     mock_files = [
@@ -94,31 +235,37 @@ def test_backup_functionality():
         "controller/TestEntityController.java"
     ]
     
-    for file_path in mock_files:
-        full_path = mock_service_dir / file_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(full_path, 'w') as f:
-            f.write(f"// Mock {file_path}\npublic class MockClass {{\n    // Mock content\n}}")
+    # Create each package directory once
+    for parent in {(mock_service_dir / file_path).parent for file_path in mock_files}:
+        parent.mkdir(parents=True, exist_ok=True)
+    
+    # The files share their content, so write it once and hard link the rest to it
+    master = mock_service_dir / mock_files[0]
+    master.write_text(MOCK_JAVA_SOURCE)
+    for file_path in mock_files[1:]:
+        target = mock_service_dir / file_path
+        try:
+            os.link(master, target)
+        except OSError:
+            target.write_text(MOCK_JAVA_SOURCE)
     
     print(f"✅ Mock project structure created: {mock_project}")
     return mock_project
 
-def test_dry_run_mode():
+def test_dry_run_mode(base: Path = BASE):
     """Test dry run mode functionality."""
     print("🧪 Testing dry run mode...")
     
     try:
-        # Import the field modifier
-        sys.path.append(str(Path("utilities")))
-        from field_modifier import FieldModifier
+        _require_utilities()
         
         # Create test config
         test_config = {
             "paths": {
-                "vira_services_root": str(Path("mock_vira_project").absolute()),
-                "src_main_java": str(Path("mock_vira_project/src/main/java/com/vira").absolute()),
-                "src_main_resources": str(Path("mock_vira_project/src/main/resources").absolute()),
-                "migration_path": str(Path("mock_vira_project/src/main/resources/db/migration").absolute())
+                "vira_services_root": str(base / "mock_vira_project"),
+                "src_main_java": str(base / "mock_vira_project/src/main/java/com/vira"),
+                "src_main_resources": str(base / "mock_vira_project/src/main/resources"),
+                "migration_path": str(base / "mock_vira_project/src/main/resources/db/migration")
             },
             "generation": {
                 "include_react_integration": True,
@@ -132,32 +279,29 @@ def test_dry_run_mode():
         }
         
         # Write test config
-        config_file = Path("test_config.json")
-        with open(config_file, 'w') as f:
-            json.dump(test_config, f, indent=2)
+        config_file = base / "test_config.json"
+        config_file.write_bytes(_dumps(test_config))
         
         # Test dry run
         modifier = FieldModifier(str(config_file))
         
         # Test with dry run enabled
-        operations_file = Path("test_field_operations.json")
-        if operations_file.exists():
-            # Enable dry run in the operations file
-            with open(operations_file, 'r') as f:
-                operations_data = json.load(f)
-            
-            operations_data["options"]["dry_run"] = True
-            
-            with open(operations_file, 'w') as f:
-                json.dump(operations_data, f, indent=2)
-            
-            print("✅ Dry run mode test setup complete")
-            return modifier, operations_file, config_file
-        else:
+        operations_file = base / "test_field_operations.json"
+        try:
+            # A single open and read; a missing file is reported below
+            operations_data = _loads(operations_file.read_bytes())
+        except FileNotFoundError:
             print("❌ Test operations file not found")
             return None, None, None
+        
+        # Enable dry run; handed to the modifier as parsed data, so it is not written back and re-read
+        operations_data["options"]["dry_run"] = True
+        
+        print("✅ Dry run mode test setup complete")
+        return modifier, operations_data, config_file
             
-    except Exception as e:
+    except (ImportError, OSError, ValueError, KeyError) as e:
+        # ValueError covers malformed JSON and a missing project root in the config
         print(f"❌ Dry run test setup failed: {str(e)}")
         return None, None, None
 
@@ -166,18 +310,10 @@ def test_impact_analysis():
     print("🧪 Testing impact analysis...")
     
     try:
-        sys.path.append(str(Path("utilities")))
-        from field_modifier import ImpactAnalyzer, FieldOperation
-        import logging
+        _require_utilities()
         
-        # Setup logger
-        logger = logging.getLogger("TestLogger")
-        logger.setLevel(logging.INFO)
-        handler = logging.StreamHandler()
-        logger.addHandler(handler)
-        
-        # Create analyzer
-        analyzer = ImpactAnalyzer(logger)
+        # Get the analyzer
+        analyzer = _get_impact_analyzer()
         
         # Test service info
         service_info = {
@@ -213,66 +349,21 @@ def test_impact_analysis():
         
         return analysis
         
-    except Exception as e:
+    except (ImportError, KeyError, ValueError) as e:
         print(f"❌ Impact analysis test failed: {str(e)}")
         return None
 
-def test_file_parser():
+def test_file_parser(base: Path = BASE):
     """Test Java file parsing functionality."""
     print("🧪 Testing Java file parser...")
     
     try:
-        sys.path.append(str(Path("utilities")))
-        from file_updater import JavaFileParser
+        _require_utilities()
         
-        # Create test Java file
-        test_java_content = """package com.vira.test.model;
-
-import jakarta.persistence.*;
-import jakarta.validation.constraints.*;
-
-/**
- * Test entity for parsing
- */
-@Entity
-@Table(name = "test_table")
-public class TestEntity {
 
-    /**
-     * Primary key
-     */
-    @Id
-    @GeneratedValue(strategy = GenerationType.IDENTITY)
-    private Long id;
-
-    /**
-     * Test name field
-     */
-    @Column(name = "name", nullable = false, length = 100)
-    @NotNull(message = "Name is required")
-    @Size(max = 100)
-    private String name;
-
-    /**
-     * Test description field
-     */
-    @Column(name = "description")
-    private String description;
-
-    // Constructors
-    public TestEntity() {}
-
-    // Getters and setters
-    public Long getId() { return id; }
-    public void setId(Long id) { this.id = id; }
-
-    public String getName() { return name; }
-    public void setName(String name) { this.name = name; }
-}"""
-
-        test_java_file = Path("TestEntity.java")
-        with open(test_java_file, 'w') as f:
-            f.write(test_java_content)
+        # Create test Java file
+        test_java_file = base / "TestEntity.java"
+        test_java_file.write_text(TEST_ENTITY_SOURCE)
         
         # Parse the file
         parser = JavaFileParser()
@@ -290,133 +381,220 @@ public class TestEntity {
         
         # Display fields
         for field in structure['fields']:
-            print(f"     • {field['name']} ({field['type']}) - {len(field['annotations'])} annotations")
+            print(f"     • {field.name} ({field.type}) - {len(field.annotations)} annotations")
         
         return structure
         
-    except Exception as e:
+    except (ImportError, OSError, KeyError) as e:
         print(f"❌ File parser test failed: {str(e)}")
         return None
 
+def test_service_update_order(base: Path = BASE):
+    """Test that a field removed and re-added in one request keeps its new service mappings."""
+    print("🧪 Testing service update order...")
+    
+    try:
+        _require_utilities()
+        
+        service_file = base / "TestEntityService.java"
+        service_file.write_text(TEST_SERVICE_SOURCE)
+        
+        # Remove the field, then add it back with a new type
+        operations = [
+            FieldOperation("remove", {"field_name": "title"}),
+            FieldOperation("add", {
+                "field": {
+                    "name": "title",
+                    "type": "VARCHAR(200)",
+                    "javaType": "String",
+                    "nullable": True
+                }
+            })
+        ]
+        service_info = {"name": "test", "table": "test_table", "entity": "TestEntity"}
+        
+        updater = JavaFileUpdater(logging.getLogger("TestLogger"))
+        if not updater.update_service_file(service_file, operations, service_info):
+            print("❌ Service file update failed")
+            return False
+        
+        content = service_file.read_text()
+        expected_mappings = [
+            "testentity.setTitle(request.getTitle());",
+            "response.setTitle(testentity.getTitle());"
+        ]
+        missing = [mapping for mapping in expected_mappings if content.count(mapping) != 1]
+        if missing:
+            print(f"❌ Re-added field mappings missing or duplicated: {missing}")
+            return False
+        
+        print("✅ Re-added field keeps its service mappings")
+        return True
+        
+    except (ImportError, OSError, ValueError, KeyError) as e:
+        print(f"❌ Service update order test failed: {str(e)}")
+        return False
+
 def test_template_rendering():
     """Test template rendering functionality."""
     print("🧪 Testing template rendering...")
     
+    try:
+        from jinja2 import TemplateError
+    except ImportError as e:
+        print(f"❌ Template rendering test failed: {str(e)}")
+        return False
+    
     try:
         # Check if templates exist
-        templates_dir = Path("utilities/templates/field_operations")
-        if not templates_dir.exists():
-            print("⚠️  Template directory not found, creating basic test...")
-            templates_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Create a simple test template
-            test_template = templates_dir / "test_migration.sql.j2"
-            with open(test_template, 'w') as f:
-                f.write("""-- Test Migration: {{ migration_version }}
--- Service: {{ service_name }}
--- Table: {{ table_name }}
-
-{% for operation in add_operations %}
--- Add field: {{ operation.field.name }}
-ALTER TABLE {{ table_name }} ADD COLUMN {{ operation.field.name }} {{ operation.field.type }};
-{% endfor %}
-
--- Migration completed""")
+        if not TEMPLATES_DIR.exists():
+            print(f"❌ Template directory not found: {TEMPLATES_DIR}")
+            return False
         
-        # Test template rendering
-        from jinja2 import Environment, FileSystemLoader
+        jinja_env = _get_jinja_env()
         
-        jinja_env = Environment(loader=FileSystemLoader(str(templates_dir)))
-        
-        # Check available templates
-        available_templates = list(templates_dir.glob("*.j2"))
+        # Check available templates by name only; the one rendered below is the only one read
+        available_templates = [name for name in os.listdir(TEMPLATES_DIR) if name.endswith('.j2')]
         print(f"✅ Templates found: {len(available_templates)}")
-        for template in available_templates:
-            print(f"   • {template.name}")
-        
+        for template_name in available_templates:
+            print(f"   • {template_name}")
+        
+        # Render the migration template for the valid operations fixture
+        operations = VALID_OPERATIONS["field_operations"]
+        service = VALID_OPERATIONS["target_service"]
+        rendered = jinja_env.get_template("migration_alter.sql.j2").render(
+            migration_version="V999",
+            service_name=service["name"],
+            table_name=service["table"],
+            service_description=f"{service['name']} service",
+            operations_summary=f"Add {len(operations)} field",
+            generation_date=time.strftime("%Y-%m-%d %H:%M:%S"),
+            add_operations=[op for op in operations if op["action"] == "add"],
+            update_operations=[op for op in operations if op["action"] == "update"],
+            remove_operations=[op for op in operations if op["action"] == "remove"],
+            fields_with_updated_at=False
+        )
+        
+        if "ADD COLUMN test_field VARCHAR(100)" not in rendered:
+            print("❌ Rendered migration is missing the added column")
+            return False
+        
+        print("✅ Migration template rendered")
         return True
         
-    except Exception as e:
+    except (OSError, TemplateError) as e:
         print(f"❌ Template rendering test failed: {str(e)}")
         return False
 
-def run_comprehensive_test():
-    """Run comprehensive test of field management functionality."""
-    print("🚀 Starting Comprehensive Field Management Test")
-    print("=" * 60)
+@dataclass
+class TestResults:
+    """Outcome of each test in the comprehensive run, in reporting order."""
+    __test__ = False  # Not a pytest test class
+    # Declared by hand, since dataclass(slots=True) needs Python 3.10; a slot can't
+    # have a class-level default, so the fields have none (see not_run)
+    __slots__ = ('json_validation', 'backup_functionality', 'dry_run_mode',
+                 'impact_analysis', 'file_parser', 'template_rendering', 'service_update_order')
     
-    test_results = {
-        "json_validation": False,
-        "backup_functionality": False,
-        "dry_run_mode": False,
-        "impact_analysis": False,
-        "file_parser": False,
-        "template_rendering": False
-    }
+    json_validation: bool
+    backup_functionality: bool
+    dry_run_mode: bool
+    impact_analysis: bool
+    file_parser: bool
+    template_rendering: bool
+    service_update_order: bool
     
-    try:
-        # Change to utilities directory
-        original_dir = Path.cwd()
-        utilities_dir = Path("utilities")
-        if utilities_dir.exists():
-            os.chdir(utilities_dir)
+    @classmethod
+    def not_run(cls) -> "TestResults":
+        """Results with every test marked as failed, before any has run."""
+        return cls(*(False for _ in cls.__slots__))
+    
+    def iter_items(self):
+        """Yield (test name, passed) pairs."""
+        return ((field.name, getattr(self, field.name)) for field in fields(self))
+    
+    def passed(self) -> int:
+        """Number of tests that passed."""
+        return sum(1 for _, result in self.iter_items() if result)
+    
+    def total(self) -> int:
+        """Number of tests run."""
+        return len(fields(self))
+
+def _run_all(base: Path, test_results: TestResults):
+    """Run every test against fixtures created under base, recording results as they finish."""
+    # Tests 1, 2, 4 and 5 only create their own fixtures under base, so run them concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        json_future = executor.submit(test_json_validation, base)
+        backup_future = executor.submit(test_backup_functionality, base)
+        parser_future = executor.submit(test_file_parser, base)
+        template_future = executor.submit(test_template_rendering)
         
         # Test 1: JSON Validation
-        test_file, invalid_file = test_json_validation()
-        test_results["json_validation"] = test_file.exists() and invalid_file.exists()
+        test_file, invalid_file = json_future.result()
+        test_results.json_validation = test_file.exists() and invalid_file.exists()
         
         # Test 2: Backup Functionality
-        mock_project = test_backup_functionality()
-        test_results["backup_functionality"] = mock_project.exists()
-        
-        # Test 3: Impact Analysis
-        analysis = test_impact_analysis()
-        test_results["impact_analysis"] = analysis is not None
+        mock_project = backup_future.result()
+        test_results.backup_functionality = mock_project.exists()
         
         # Test 4: File Parser
-        structure = test_file_parser()
-        test_results["file_parser"] = structure is not None
+        structure = parser_future.result()
+        test_results.file_parser = structure is not None
         
         # Test 5: Template Rendering
-        template_success = test_template_rendering()
-        test_results["template_rendering"] = template_success
-        
-        # Test 6: Dry Run Mode
-        modifier, operations_file, config_file = test_dry_run_mode()
-        test_results["dry_run_mode"] = modifier is not None
-        
-        # Execute actual dry run test
-        if modifier and operations_file:
-            print("🧪 Executing dry run test...")
-            try:
-                success = modifier.process_field_operations(str(operations_file))
-                print(f"✅ Dry run execution: {'Success' if success else 'Failed'}")
-            except Exception as e:
-                print(f"⚠️  Dry run execution failed: {str(e)}")
-        
-    except Exception as e:
-        print(f"❌ Comprehensive test failed: {str(e)}")
+        template_success = template_future.result()
+        test_results.template_rendering = template_success
+    
+    # Test 3: Impact Analysis
+    analysis = test_impact_analysis()
+    test_results.impact_analysis = analysis is not None
+    
+    # Test 6: Dry Run Mode
+    modifier, operations_data, config_file = test_dry_run_mode(base)
+    test_results.dry_run_mode = modifier is not None
+    
+    # Execute actual dry run test
+    if modifier and operations_data:
+        print("🧪 Executing dry run test...")
+        try:
+            success = modifier.process_field_operations(operations_data)
+            print(f"✅ Dry run execution: {'Success' if success else 'Failed'}")
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️  Dry run execution failed: {str(e)}")
+    
+    # Test 7: Service Update Order
+    test_results.service_update_order = test_service_update_order(base)
+
+def run_comprehensive_test():
+    """Run comprehensive test of field management functionality."""
+    print("🚀 Starting Comprehensive Field Management Test")
+    print("=" * 60)
+    
+    test_results = TestResults.not_run()
     
-    finally:
-        # Return to original directory
-        os.chdir(original_dir)
+    _cleanup_legacy()
+    
+    # All fixtures live in one temporary directory, removed in a single pass on exit
+    with tempfile.TemporaryDirectory(prefix="vira_test_") as temp_dir:
+        try:
+            _run_all(Path(temp_dir), test_results)
+        except Exception as e:
+            # Last-resort guard so the summary is still printed
+            print(f"❌ Comprehensive test failed: {str(e)}")
         
-        # Cleanup test files
-        cleanup_test_files()
+        print("🧹 Cleaning up test files...")
     
     # Print results
     print("\n" + "=" * 60)
     print("📊 TEST RESULTS SUMMARY")
     print("=" * 60)
     
-    passed = 0
-    total = len(test_results)
+    passed = test_results.passed()
+    total = test_results.total()
     
-    for test_name, result in test_results.items():
+    for test_name, result in test_results.iter_items():
         status = "✅ PASS" if result else "❌ FAIL"
         print(f"{test_name.replace('_', ' ').title():<25} {status}")
-        if result:
-            passed += 1
     
     print("=" * 60)
     print(f"Overall: {passed}/{total} tests passed ({passed/total*100:.1f}%)")
@@ -430,39 +608,35 @@ def run_comprehensive_test():
     
     return test_results
 
-def cleanup_test_files():
-    """Clean up test files created during testing."""
-    print("🧹 Cleaning up test files...")
-    
-    test_files = [
-        "test_field_operations.json",
-        "test_invalid_operations.json",
-        "test_config.json",
-        "TestEntity.java",
-        "mock_vira_project"
-    ]
-    
-    for file_path in test_files:
-        path = Path(file_path)
+def _cleanup_legacy():
+    """Remove fixtures left next to the script by versions that did not use a temporary directory."""
+    removed = []
+    failed = []
+    for path in LEGACY_FIXTURE_PATHS:
         try:
-            if path.exists():
-                if path.is_dir():
-                    shutil.rmtree(path)
-                else:
-                    path.unlink()
-                print(f"   Removed: {file_path}")
-        except Exception as e:
-            print(f"   Failed to remove {file_path}: {str(e)}")
+            if path.is_dir():
+                shutil.rmtree(path)
+            elif path.exists():
+                path.unlink()
+            else:
+                continue
+            removed.append(path.name)
+        except OSError as e:
+            failed.append(f"{path.name} ({e})")
+    
+    # One line each, instead of a print per file
+    logger = logging.getLogger("TestLogger")
+    if removed:
+        logger.debug("Removed stale fixtures: %s", ", ".join(removed))
+    if failed:
+        logger.warning("Failed to remove stale fixtures: %s", "; ".join(failed))
 
 if __name__ == "__main__":
     # Run the comprehensive test
     results = run_comprehensive_test()
     
     # Exit with appropriate code
-    passed_count = sum(1 for result in results.values() if result)
-    total_count = len(results)
-    
-    if passed_count == total_count:
+    if results.passed() == results.total():
         sys.exit(0)  # All tests passed
     else:
         sys.exit(1)  # Some tests failed 
\ No newline at end of file